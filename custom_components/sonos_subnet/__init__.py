@@ -3,26 +3,37 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Final
+
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import voluptuous as vol
 
 from .const import (
     DOMAIN,
     CONF_SPEAKER_IPS,
+    CONF_EVENT_PORT,
+    DEFAULT_EVENT_PORT,
+    DEFAULT_SCAN_TIMEOUT,
     SERVICE_SCAN_SUBNET,
     SERVICE_ADD_SPEAKER,
     SERVICE_JOIN,
     SERVICE_UNJOIN,
     SERVICE_SET_SLEEP_TIMER,
     SERVICE_CLEAR_SLEEP_TIMER,
+    SERVICE_PLAY_ALL,
+    SERVICE_PAUSE_ALL,
     ATTR_IP_ADDRESS,
     ATTR_MASTER,
+    ATTR_ENTITY_ID,
+    ATTR_MASTER_ENTITY_ID,
     ATTR_SLEEP_TIME,
+    ATTR_EXPECTED_DEVICES,
     CONTROL_AV_TRANSPORT,
     UPNP_AV_TRANSPORT,
 )
@@ -32,42 +43,74 @@ from .helpers import send_upnp_command
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
+# SOAP argument bodies for the service handlers, built once at import
+JOIN_ARGS_TEMPLATE = (
+    "<InstanceID>0</InstanceID><CurrentURI>x-rincon:%s</CurrentURI>"
+    "<CurrentURIMetaData></CurrentURIMetaData>"
+)
+UNJOIN_ARGS = "<InstanceID>0</InstanceID>"
+SLEEP_TIMER_ARGS_TEMPLATE = (
+    "<InstanceID>0</InstanceID><NewSleepTimerDuration>%s</NewSleepTimerDuration>"
+)
+CLEAR_SLEEP_TIMER_ARGS = SLEEP_TIMER_ARGS_TEMPLATE % ""
+PLAY_ARGS = "<InstanceID>0</InstanceID><Speed>1</Speed>"
+PAUSE_ARGS = "<InstanceID>0</InstanceID>"
+
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.MEDIA_PLAYER,
     Platform.NUMBER,
     Platform.SWITCH,
-]
+)
+
+EVENT_DEVICES_DISCOVERED: Final = f"{DOMAIN}_devices_discovered"
+
+SERVICES: Final = (
+    SERVICE_SCAN_SUBNET,
+    SERVICE_ADD_SPEAKER,
+    SERVICE_JOIN,
+    SERVICE_UNJOIN,
+    SERVICE_SET_SLEEP_TIMER,
+    SERVICE_CLEAR_SLEEP_TIMER,
+    SERVICE_PLAY_ALL,
+    SERVICE_PAUSE_ALL,
+)
+
+# Shared validators, built once and reused by the service schemas
+SLEEP_TIME_RANGE = vol.All(vol.Coerce(int), vol.Range(min=1, max=7200))
 
 SERVICE_SCAN_SCHEMA = vol.Schema({
     vol.Required("subnet"): str,
-    vol.Optional("timeout", default=5): vol.Coerce(int),
+    vol.Optional("timeout", default=DEFAULT_SCAN_TIMEOUT): vol.Coerce(int),
+    vol.Optional(ATTR_EXPECTED_DEVICES): vol.All(vol.Coerce(int), vol.Range(min=1)),
 })
 
 SERVICE_ADD_SPEAKER_SCHEMA = vol.Schema({
-    vol.Required(ATTR_IP_ADDRESS): str,
+    vol.Required(ATTR_IP_ADDRESS): vol.All(cv.ensure_list, [str]),
 })
 
 SERVICE_JOIN_SCHEMA = vol.Schema({
     vol.Optional(ATTR_IP_ADDRESS): str,
     vol.Optional(ATTR_MASTER): str,
-    vol.Optional("entity_id"): str,
-    vol.Optional("master_entity_id"): str,
+    vol.Optional(ATTR_ENTITY_ID): str,
+    vol.Optional(ATTR_MASTER_ENTITY_ID): str,
 })
 
 SERVICE_UNJOIN_SCHEMA = vol.Schema({
     vol.Optional(ATTR_IP_ADDRESS): str,
-    vol.Optional("entity_id"): str,
+    vol.Optional(ATTR_ENTITY_ID): str,
 })
 
 SERVICE_SLEEP_TIMER_SCHEMA = vol.Schema({
     vol.Required(ATTR_IP_ADDRESS): str,
-    vol.Required(ATTR_SLEEP_TIME): vol.All(vol.Coerce(int), vol.Range(min=1, max=7200)),
+    vol.Required(ATTR_SLEEP_TIME): SLEEP_TIME_RANGE,
 })
 
 SERVICE_CLEAR_SLEEP_TIMER_SCHEMA = vol.Schema({
     vol.Required(ATTR_IP_ADDRESS): str,
 })
 
+SERVICE_BROADCAST_SCHEMA = vol.Schema({})
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sonos Subnet Discovery from a config entry."""
@@ -79,130 +122,263 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(coordinator.group_refresh.async_cancel)
+    entry.async_on_unload(coordinator.command_refresh.async_cancel)
+    entry.async_on_unload(coordinator.async_cancel_settle_refresh)
+
+    await coordinator.async_start_events()
+    entry.async_on_unload(coordinator.events.async_stop)
+
+    # Services are shared by all entries, so only register them once
+    if not hass.services.has_service(DOMAIN, SERVICE_SCAN_SUBNET):
+        _async_register_services(hass)
+
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        hass.data[DOMAIN].pop(entry.entry_id)
+
+        if not hass.data[DOMAIN]:
+            for service in SERVICES:
+                hass.services.async_remove(DOMAIN, service)
+
+    return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its set of speakers or its event port changed.
+
+    Every platform builds its entities at setup, so added speakers need a
+    reload to get them and removed speakers need one to lose them. The
+    event listener binds its port once when it starts.
+    """
+    coordinator: SonosSubnetCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if (
+        coordinator is not None
+        and set(entry.data.get(CONF_SPEAKER_IPS, [])) == set(coordinator.speaker_ips)
+        and entry.data.get(CONF_EVENT_PORT, DEFAULT_EVENT_PORT) == coordinator.events.listen_port
+    ):
+        return
+    
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _get_coordinator_for_ip(
+    hass: HomeAssistant, ip_address: str
+) -> SonosSubnetCoordinator | None:
+    """Return the coordinator that manages the given speaker IP."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if ip_address in coordinator.speaker_ips:
+            return coordinator
+    return None
+
+
+def _resolve_entity_id(
+    hass: HomeAssistant, entity_id: str
+) -> tuple[SonosSubnetCoordinator, str] | None:
+    """Return the owning coordinator and speaker IP for a media_player entity."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if ip_address := coordinator.get_ip_from_entity_id(entity_id):
+            return coordinator, ip_address
+    return None
+
+
+async def _async_broadcast(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    action: str,
+    arguments: str,
+) -> None:
+    """Send one AVTransport action to every available group coordinator at once."""
+    targets = [
+        (coordinator, ip)
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+        for ip, info in (coordinator.data or {}).items()
+        if info.get("available") and info.get("is_coordinator", True)
+    ]
+    
+    results = await asyncio.gather(
+        *(
+            send_upnp_command(
+                ip,
+                UPNP_AV_TRANSPORT,
+                action,
+                arguments,
+                CONTROL_AV_TRANSPORT,
+                session=session,
+            )
+            for _, ip in targets
+        )
+    )
+    
+    refreshes = []
+    for (coordinator, ip), (success, _) in zip(targets, results):
+        if success:
+            refreshes.append(coordinator.async_refresh_after_command(ip))
+        else:
+            _LOGGER.error("Failed to send %s to %s", action, ip)
+    
+    await asyncio.gather(*refreshes)
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services.
+
+    Handlers resolve the owning coordinator per call so that every config
+    entry is served, not only the one that registered the services.
+    """
+    # Shared keep-alive session so service calls skip TCP setup per command
+    session = async_get_clientsession(hass)
 
-    # Register services
     async def handle_scan_subnet(call: ServiceCall) -> dict[str, Any]:
         """Handle the scan_subnet service call."""
         subnet = call.data["subnet"]
-        timeout = call.data.get("timeout", 5)
+        timeout = call.data.get("timeout", DEFAULT_SCAN_TIMEOUT)
+        expected_devices = call.data.get(ATTR_EXPECTED_DEVICES)
         
         _LOGGER.info("Scanning subnet %s for Sonos devices", subnet)
-        devices = await scan_subnet_for_sonos(hass, subnet, timeout)
+        devices = await scan_subnet_for_sonos(
+            hass, subnet, timeout, stop_on_count=expected_devices
+        )
         
         _LOGGER.info("Found %d Sonos devices on subnet %s", len(devices), subnet)
         
-        # Fire an event with the discovered devices
-        hass.bus.async_fire(f"{DOMAIN}_devices_discovered", {
-            "subnet": subnet,
-            "devices": devices,
-        })
+        # Fire an event with the discovered devices on the next loop
+        # iteration so callback listeners don't delay the service response
+        hass.loop.call_soon(
+            hass.bus.async_fire,
+            EVENT_DEVICES_DISCOVERED,
+            {"subnet": subnet, "devices": devices},
+        )
         
         return {"devices": devices}
 
     async def handle_add_speaker(call: ServiceCall) -> None:
-        """Handle the add_speaker service call."""
-        ip_address = call.data[ATTR_IP_ADDRESS]
+        """Handle the add_speaker service call for one or more IPs."""
+        ip_addresses = [
+            ip for ip in dict.fromkeys(call.data[ATTR_IP_ADDRESS])
+            if not _get_coordinator_for_ip(hass, ip)
+        ]
         
-        _LOGGER.info("Adding Sonos speaker at %s", ip_address)
+        if not ip_addresses:
+            _LOGGER.info("All requested Sonos speakers are already configured")
+            return
         
-        speaker_info = await validate_sonos_ip(hass, ip_address)
-        if speaker_info:
-            # Add to coordinator
-            await coordinator.async_add_speaker(ip_address, speaker_info)
-            _LOGGER.info("Successfully added Sonos speaker: %s", speaker_info.get("zone_name", ip_address))
-        else:
-            _LOGGER.error("No Sonos device found at %s", ip_address)
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SCAN_SUBNET,
-        handle_scan_subnet,
-        schema=SERVICE_SCAN_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_SPEAKER,
-        handle_add_speaker,
-        schema=SERVICE_ADD_SPEAKER_SCHEMA,
-    )
+        coordinators = list(hass.data.get(DOMAIN, {}).values())
+        if not coordinators:
+            _LOGGER.error("No Sonos Subnet entry is loaded to add speakers to")
+            return
+        
+        _LOGGER.info("Adding Sonos speakers at %s", ", ".join(ip_addresses))
+        
+        results = await asyncio.gather(
+            *(validate_sonos_ip(hass, ip, session=session) for ip in ip_addresses),
+            return_exceptions=True,
+        )
+        
+        new_speakers: dict[str, dict[str, Any]] = {}
+        for ip_address, speaker_info in zip(ip_addresses, results):
+            if isinstance(speaker_info, dict) and speaker_info:
+                new_speakers[ip_address] = speaker_info
+                _LOGGER.info("Successfully added Sonos speaker: %s", speaker_info.get("zone_name", ip_address))
+            else:
+                _LOGGER.error("No Sonos device found at %s", ip_address)
+        
+        if new_speakers:
+            # Add to the first loaded entry in one batch
+            await coordinators[0].async_add_speakers(new_speakers)
 
     # Join/Unjoin services for grouping
     async def handle_join(call: ServiceCall) -> None:
         """Handle the join service call - group a speaker with a master."""
         ip_address = call.data.get(ATTR_IP_ADDRESS)
         master = call.data.get(ATTR_MASTER)
-        entity_id = call.data.get("entity_id")
-        master_entity_id = call.data.get("master_entity_id")
+        entity_id = call.data.get(ATTR_ENTITY_ID)
+        master_entity_id = call.data.get(ATTR_MASTER_ENTITY_ID)
         
         # Support both entity_id and IP address
         if entity_id:
-            ip_address = coordinator.get_ip_from_entity_id(entity_id)
-            if not ip_address:
+            if not (resolved := _resolve_entity_id(hass, entity_id)):
                 _LOGGER.error("Entity %s not found", entity_id)
                 return
+            _, ip_address = resolved
         
         if master_entity_id:
-            master = coordinator.get_ip_from_entity_id(master_entity_id)
-            if not master:
+            if not (resolved := _resolve_entity_id(hass, master_entity_id)):
                 _LOGGER.error("Master entity %s not found", master_entity_id)
                 return
+            _, master = resolved
         
         if not ip_address or not master:
             _LOGGER.error("Both speaker and master must be specified")
             return
         
-        _LOGGER.info("Joining %s to master %s", ip_address, master)
+        _LOGGER.debug("Joining %s to master %s", ip_address, master)
         
         # Get master's coordinator URI
-        master_data = coordinator.speakers.get(master, {})
-        master_uuid = master_data.get("uuid", "")
+        master_coordinator = _get_coordinator_for_ip(hass, master)
+        master_uuid = None
+        if master_coordinator:
+            try:
+                master_uuid = master_coordinator.speakers[master]["uuid"]
+            except KeyError:
+                pass
         
         if not master_uuid:
             _LOGGER.error("Master speaker %s not found", master)
             return
         
-        coordinator_uri = f"x-rincon:{master_uuid}"
-        
         success, _ = await send_upnp_command(
             ip_address,
             UPNP_AV_TRANSPORT,
             "SetAVTransportURI",
-            f"<InstanceID>0</InstanceID><CurrentURI>{coordinator_uri}</CurrentURI><CurrentURIMetaData></CurrentURIMetaData>",
+            JOIN_ARGS_TEMPLATE % master_uuid,
             CONTROL_AV_TRANSPORT,
+            session=session,
         )
         
         if success:
-            await coordinator.async_request_refresh()
+            coordinator = _get_coordinator_for_ip(hass, ip_address) or master_coordinator
+            coordinator.async_apply_join(ip_address, master)
+            await coordinator.group_refresh.async_call()
+            if master_coordinator is not coordinator:
+                await master_coordinator.group_refresh.async_call()
 
     async def handle_unjoin(call: ServiceCall) -> None:
         """Handle the unjoin service call - remove speaker from group."""
         ip_address = call.data.get(ATTR_IP_ADDRESS)
-        entity_id = call.data.get("entity_id")
+        entity_id = call.data.get(ATTR_ENTITY_ID)
         
         # Support both entity_id and IP address
         if entity_id:
-            ip_address = coordinator.get_ip_from_entity_id(entity_id)
-            if not ip_address:
+            if not (resolved := _resolve_entity_id(hass, entity_id)):
                 _LOGGER.error("Entity %s not found", entity_id)
                 return
+            _, ip_address = resolved
         
         if not ip_address:
             _LOGGER.error("Speaker must be specified")
             return
         
-        _LOGGER.info("Unjoining %s from group", ip_address)
+        _LOGGER.debug("Unjoining %s from group", ip_address)
         
         success, _ = await send_upnp_command(
             ip_address,
             UPNP_AV_TRANSPORT,
             "BecomeCoordinatorOfStandaloneGroup",
-            "<InstanceID>0</InstanceID>",
+            UNJOIN_ARGS,
             CONTROL_AV_TRANSPORT,
+            session=session,
         )
         
-        if success:
-            await coordinator.async_request_refresh()
+        if success and (coordinator := _get_coordinator_for_ip(hass, ip_address)):
+            coordinator.async_apply_unjoin(ip_address)
+            await coordinator.group_refresh.async_call()
 
     async def handle_set_sleep_timer(call: ServiceCall) -> None:
         """Handle the set_sleep_timer service call."""
@@ -210,75 +386,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sleep_time = call.data[ATTR_SLEEP_TIME]
         
         # Convert seconds to ISO 8601 duration format
-        hours = sleep_time // 3600
-        minutes = (sleep_time % 3600) // 60
-        seconds = sleep_time % 60
+        minutes, seconds = divmod(sleep_time, 60)
+        hours, minutes = divmod(minutes, 60)
         duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         
-        _LOGGER.info("Setting sleep timer to %s on %s", duration, ip_address)
+        _LOGGER.debug("Setting sleep timer to %s on %s", duration, ip_address)
         
         success, _ = await send_upnp_command(
             ip_address,
             UPNP_AV_TRANSPORT,
             "ConfigureSleepTimer",
-            f"<InstanceID>0</InstanceID><NewSleepTimerDuration>{duration}</NewSleepTimerDuration>",
+            SLEEP_TIMER_ARGS_TEMPLATE % duration,
             CONTROL_AV_TRANSPORT,
+            session=session,
         )
 
     async def handle_clear_sleep_timer(call: ServiceCall) -> None:
         """Handle the clear_sleep_timer service call."""
         ip_address = call.data[ATTR_IP_ADDRESS]
         
-        _LOGGER.info("Clearing sleep timer on %s", ip_address)
+        _LOGGER.debug("Clearing sleep timer on %s", ip_address)
         
         success, _ = await send_upnp_command(
             ip_address,
             UPNP_AV_TRANSPORT,
             "ConfigureSleepTimer",
-            "<InstanceID>0</InstanceID><NewSleepTimerDuration></NewSleepTimerDuration>",
+            CLEAR_SLEEP_TIMER_ARGS,
             CONTROL_AV_TRANSPORT,
+            session=session,
         )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_JOIN,
-        handle_join,
-        schema=SERVICE_JOIN_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UNJOIN,
-        handle_unjoin,
-        schema=SERVICE_UNJOIN_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_SLEEP_TIMER,
-        handle_set_sleep_timer,
-        schema=SERVICE_SLEEP_TIMER_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CLEAR_SLEEP_TIMER,
-        handle_clear_sleep_timer,
-        schema=SERVICE_CLEAR_SLEEP_TIMER_SCHEMA,
-    )
-
-    return True
-
-
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok
-
-
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    async def handle_play_all(call: ServiceCall) -> None:
+        """Handle the play_all service call."""
+        await _async_broadcast(hass, session, "Play", PLAY_ARGS)
+
+    async def handle_pause_all(call: ServiceCall) -> None:
+        """Handle the pause_all service call."""
+        await _async_broadcast(hass, session, "Pause", PAUSE_ARGS)
+
+    for service, handler, schema in (
+        (SERVICE_SCAN_SUBNET, handle_scan_subnet, SERVICE_SCAN_SCHEMA),
+        (SERVICE_ADD_SPEAKER, handle_add_speaker, SERVICE_ADD_SPEAKER_SCHEMA),
+        (SERVICE_JOIN, handle_join, SERVICE_JOIN_SCHEMA),
+        (SERVICE_UNJOIN, handle_unjoin, SERVICE_UNJOIN_SCHEMA),
+        (SERVICE_SET_SLEEP_TIMER, handle_set_sleep_timer, SERVICE_SLEEP_TIMER_SCHEMA),
+        (SERVICE_CLEAR_SLEEP_TIMER, handle_clear_sleep_timer, SERVICE_CLEAR_SLEEP_TIMER_SCHEMA),
+        (SERVICE_PLAY_ALL, handle_play_all, SERVICE_BROADCAST_SCHEMA),
+        (SERVICE_PAUSE_ALL, handle_pause_all, SERVICE_BROADCAST_SCHEMA),
+    ):
+        hass.services.async_register(DOMAIN, service, handler, schema=schema)
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
@@ -17,12 +17,25 @@ from .const import (
     CONF_SPEAKER_IPS,
     CONF_SCAN_SUBNET,
     CONF_SCAN_TIMEOUT,
+    CONF_EVENT_PORT,
     DEFAULT_SCAN_TIMEOUT,
+    DEFAULT_EVENT_PORT,
 )
 from .discovery import validate_sonos_ip, scan_subnet_for_sonos
 
 _LOGGER = logging.getLogger(__name__)
 
+# Hard ceiling for validating a single manually entered IP (seconds)
+MANUAL_VALIDATION_TIMEOUT: Final = 2.0
+
+# Static form placeholders
+USER_MENU_PLACEHOLDERS: Final = {
+    "manual": "Enter IP addresses manually",
+    "scan": "Scan a subnet for devices",
+}
+MANUAL_PLACEHOLDERS: Final = {"example": "192.168.2.100, 192.168.2.101"}
+SCAN_PLACEHOLDERS: Final = {"example": "192.168.2.0/24"}
+
 
 class SonosSubnetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Sonos Subnet Discovery."""
@@ -41,10 +54,7 @@ class SonosSubnetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_menu(
             step_id="user",
             menu_options=["manual", "scan"],
-            description_placeholders={
-                "manual": "Enter IP addresses manually",
-                "scan": "Scan a subnet for devices",
-            },
+            description_placeholders=USER_MENU_PLACEHOLDERS,
         )
 
     async def async_step_manual(
@@ -56,19 +66,25 @@ class SonosSubnetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             ip_addresses = user_input.get(CONF_SPEAKER_IPS, "")
             
-            # Parse comma-separated IPs
-            ips = [ip.strip() for ip in ip_addresses.split(",") if ip.strip()]
+            # Parse comma-separated IPs, dropping duplicates but keeping order
+            ips = list(dict.fromkeys(
+                ip.strip() for ip in ip_addresses.split(",") if ip.strip()
+            ))
             
             if not ips:
                 errors["base"] = "no_ips"
             else:
-                # Validate each IP
+                # Validate all IPs concurrently
                 valid_ips: list[str] = []
                 invalid_ips: list[str] = []
-                
-                for ip in ips:
-                    speaker_info = await validate_sonos_ip(self.hass, ip)
-                    if speaker_info:
+
+                results = await asyncio.gather(
+                    *(self._async_validate_with_deadline(ip) for ip in ips),
+                    return_exceptions=True,
+                )
+
+                for ip, speaker_info in zip(ips, results):
+                    if isinstance(speaker_info, dict) and speaker_info:
                         valid_ips.append(ip)
                         self._discovered_devices.append(speaker_info)
                     else:
@@ -89,11 +105,21 @@ class SonosSubnetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_SPEAKER_IPS): str,
             }),
             errors=errors,
-            description_placeholders={
-                "example": "192.168.2.100, 192.168.2.101",
-            },
+            description_placeholders=MANUAL_PLACEHOLDERS,
         )
 
+    async def _async_validate_with_deadline(self, ip: str) -> dict[str, Any] | None:
+        """Validate an IP, giving up after a hard per-IP deadline."""
+        try:
+            return await asyncio.wait_for(
+                # Validation makes two sequential requests; split the budget
+                validate_sonos_ip(self.hass, ip, timeout=MANUAL_VALIDATION_TIMEOUT / 2),
+                timeout=MANUAL_VALIDATION_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Timed out validating Sonos device at %s", ip)
+            return None
+
     async def async_step_scan(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -129,9 +155,7 @@ class SonosSubnetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ),
             }),
             errors=errors,
-            description_placeholders={
-                "example": "192.168.2.0/24",
-            },
+            description_placeholders=SCAN_PLACEHOLDERS,
         )
 
     async def async_step_select_devices(
@@ -144,16 +168,18 @@ class SonosSubnetConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._speaker_ips = selected_ips
                 return await self.async_step_confirm()
 
-        # Build device selection options
-        device_options = {
-            device["ip_address"]: f"{device.get('zone_name', 'Unknown')} ({device['ip_address']}) - {device.get('model_name', 'Unknown')}"
-            for device in self._discovered_devices
-        }
+        # Build device selection options in a single pass
+        device_ips: list[str] = []
+        device_options: dict[str, str] = {}
+        for device in self._discovered_devices:
+            ip = device["ip_address"]
+            device_ips.append(ip)
+            device_options[ip] = f"{device.get('zone_name', 'Unknown')} ({ip}) - {device.get('model_name', 'Unknown')}"
 
         return self.async_show_form(
             step_id="select_devices",
             data_schema=vol.Schema({
-                vol.Required("selected_devices", default=list(device_options.keys())): cv.multi_select(device_options),
+                vol.Required("selected_devices", default=device_ips): cv.multi_select(device_options),
             }),
         )
 
@@ -215,7 +241,7 @@ class SonosSubnetOptionsFlow(config_entries.OptionsFlow):
         """Manage the options."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["add_device", "remove_device", "scan_subnet"],
+            menu_options=["add_device", "remove_device", "scan_subnet", "event_settings"],
         )
 
     async def async_step_add_device(
@@ -227,23 +253,22 @@ class SonosSubnetOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             ip_address = user_input.get("ip_address", "").strip()
             
-            if ip_address:
-                speaker_info = await validate_sonos_ip(self.hass, ip_address)
-                if speaker_info:
-                    current_ips = list(self.config_entry.data.get(CONF_SPEAKER_IPS, []))
-                    if ip_address not in current_ips:
-                        current_ips.append(ip_address)
-                        self.hass.config_entries.async_update_entry(
-                            self.config_entry,
-                            data={**self.config_entry.data, CONF_SPEAKER_IPS: current_ips},
-                        )
-                        return self.async_create_entry(title="", data={})
-                    else:
-                        errors["base"] = "already_configured"
-                else:
-                    errors["base"] = "no_device_found"
-            else:
+            current_ips = list(self.config_entry.data.get(CONF_SPEAKER_IPS, []))
+            
+            if not ip_address:
                 errors["base"] = "invalid_ip"
+            elif ip_address in current_ips:
+                # Skip the network probe for speakers we already have
+                errors["base"] = "already_configured"
+            elif await validate_sonos_ip(self.hass, ip_address):
+                current_ips.append(ip_address)
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data={**self.config_entry.data, CONF_SPEAKER_IPS: current_ips},
+                )
+                return self.async_create_entry(title="", data={})
+            else:
+                errors["base"] = "no_device_found"
 
         return self.async_show_form(
             step_id="add_device",
@@ -315,6 +340,27 @@ class SonosSubnetOptionsFlow(config_entries.OptionsFlow):
             errors=errors,
         )
 
+    async def async_step_event_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Choose the local port speakers send events to."""
+        if user_input is not None:
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                data={**self.config_entry.data, CONF_EVENT_PORT: user_input[CONF_EVENT_PORT]},
+            )
+            return self.async_create_entry(title="", data={})
+
+        return self.async_show_form(
+            step_id="event_settings",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_EVENT_PORT,
+                    default=self.config_entry.data.get(CONF_EVENT_PORT, DEFAULT_EVENT_PORT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1024, max=65535)),
+            }),
+        )
+
     async def async_step_select_new_devices(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -322,8 +368,10 @@ class SonosSubnetOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             selected_ips = user_input.get("selected_devices", [])
             if selected_ips:
-                current_ips = list(self.config_entry.data.get(CONF_SPEAKER_IPS, []))
-                current_ips.extend(selected_ips)
+                # Keep the stored order; new speakers go at the end
+                current_ips = list(dict.fromkeys(
+                    [*self.config_entry.data.get(CONF_SPEAKER_IPS, []), *selected_ips]
+                ))
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
                     data={**self.config_entry.data, CONF_SPEAKER_IPS: current_ips},
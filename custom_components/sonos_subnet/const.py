@@ -8,10 +8,13 @@ CONF_SPEAKER_IPS: Final = "speaker_ips"
 CONF_SCAN_SUBNET: Final = "scan_subnet"
 CONF_SUBNET_RANGE: Final = "subnet_range"
 CONF_SCAN_TIMEOUT: Final = "scan_timeout"
+CONF_EVENT_PORT: Final = "event_port"
 
 # Defaults
 DEFAULT_SCAN_TIMEOUT: Final = 5
 DEFAULT_PORT: Final = 1400
+# Local port speakers send event callbacks to; must be reachable from their subnet
+DEFAULT_EVENT_PORT: Final = 1410
 
 # Services
 SERVICE_SCAN_SUBNET: Final = "scan_subnet"
@@ -23,6 +26,11 @@ SERVICE_RESTORE: Final = "restore"
 SERVICE_SET_SLEEP_TIMER: Final = "set_sleep_timer"
 SERVICE_CLEAR_SLEEP_TIMER: Final = "clear_sleep_timer"
 SERVICE_PLAY_FAVORITE: Final = "play_favorite"
+SERVICE_PLAY_ALL: Final = "play_all"
+SERVICE_PAUSE_ALL: Final = "pause_all"
+
+# Dispatcher signal sent with a speaker's data when it changes; format with the IP
+SIGNAL_SPEAKER_UPDATED: Final = "sonos_subnet_update_{}"
 
 # Attributes
 ATTR_IP_ADDRESS: Final = "ip_address"
@@ -31,13 +39,21 @@ ATTR_HOUSEHOLD_ID: Final = "household_id"
 ATTR_MODEL_NAME: Final = "model_name"
 ATTR_ZONE_NAME: Final = "zone_name"
 ATTR_MASTER: Final = "master"
+ATTR_ENTITY_ID: Final = "entity_id"
+ATTR_MASTER_ENTITY_ID: Final = "master_entity_id"
 ATTR_WITH_GROUP: Final = "with_group"
 ATTR_SLEEP_TIME: Final = "sleep_time"
+ATTR_EXPECTED_DEVICES: Final = "expected_devices"
 ATTR_FAVORITE_ID: Final = "favorite_id"
 
 # Scan settings
 SONOS_PORT: Final = 1400
-SCAN_BATCH_SIZE: Final = 50
+SCAN_BATCH_SIZE: Final = 256
+SCAN_CONNECT_TIMEOUT: Final = 1.0
+
+# HTTP timeouts (seconds)
+CONNECT_TIMEOUT: Final = 2.0
+UPDATE_TIMEOUT: Final = 30
 
 # EQ Settings
 EQ_BASS: Final = "bass"
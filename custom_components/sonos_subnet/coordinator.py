@@ -3,32 +3,93 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timedelta
+from itertools import count
 import logging
-from typing import Any
+import time
+from types import MappingProxyType
+from typing import Any, NamedTuple, cast
+from urllib.parse import urlparse
+from xml.etree import ElementTree
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
     CONF_SPEAKER_IPS,
-    SONOS_PORT,
+    CONF_EVENT_PORT,
+    DEFAULT_EVENT_PORT,
     CONTROL_AV_TRANSPORT,
     CONTROL_RENDERING,
     CONTROL_DEVICE_PROPERTIES,
+    CONTROL_ZONE_GROUP,
     UPNP_AV_TRANSPORT,
     UPNP_RENDERING_CONTROL,
     UPNP_DEVICE_PROPERTIES,
+    UPNP_ZONE_GROUP_TOPOLOGY,
+    UPDATE_TIMEOUT,
+    SIGNAL_SPEAKER_UPDATED,
+    SONOS_PORT,
+)
+from .discovery import get_speaker_info, invalidate_speaker_info
+from .events import SonosEventListener
+from .helpers import (
+    send_upnp_command,
+    extract_xml_value,
+    parse_xml_values,
+    soap_value_int,
+    soap_value_bool,
+    parse_didl_metadata,
+    parse_duration,
+    parse_play_mode,
 )
-from .discovery import get_speaker_info
-from .helpers import send_upnp_command, extract_xml_value, extract_xml_value_int, extract_xml_value_bool, parse_didl_metadata, parse_duration
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(seconds=10)
+GROUP_REFRESH_COOLDOWN = 0.5
+# Commands landing within this window share one follow-up refresh
+COMMAND_REFRESH_COOLDOWN = 0.15
+# Back-off between extra polls while a commanded speaker is still transitioning
+SETTLE_REFRESH_DELAYS = (0.5, 1.0, 2.0)
+# Model, serial and UUID never change; the room name is polled separately
+STATIC_INFO_MAX_AGE = 86400
+# Per-speaker key bumped whenever that speaker's data actually changes
+DATA_VERSION = "data_version"
+
+
+class SpeakerState(NamedTuple):
+    """Read-only snapshot of the playback fields entities read on every write."""
+
+    available: bool | None
+    transport_state: str | None
+    volume: int | None
+    mute: bool | None
+    shuffle: bool | None
+    repeat: bool | None
+    repeat_one: bool | None
+    track_title: str | None
+    track_artist: str | None
+    track_album: str | None
+    track_uri: str | None
+    album_art_uri: str | None
+    track_duration: int | None
+    track_position: int | None
+    track_number: int | None
+    group_members: list[str] | None
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> SpeakerState:
+        """Build a snapshot from a speaker's coordinator data."""
+        return cls._make(map(data.get, cls._fields))
 
 
 class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -45,12 +106,75 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry = entry
         self._speakers: dict[str, dict[str, Any]] = {}
         self._speaker_ips: list[str] = list(entry.data.get(CONF_SPEAKER_IPS, []))
+        # Static device info per IP, stamped with when it was fetched
+        self._static_info: dict[str, tuple[float, dict[str, Any]]] = {}
+        # Device id and registry info per IP, shared by all of a speaker's entities
+        self._device_meta: dict[str, tuple[str, DeviceInfo]] = {}
+        # Shared keep-alive session reused across polls and commands
+        self._session = async_get_clientsession(hass)
+        # Expected media_player entity_id <-> IP indexes, versioned on rebuild
+        self._entity_to_ip: dict[str, str] = {}
+        self._ip_to_entity: dict[str, str] = {}
+        self._entity_index_version = 0
+        self._versions = count(1)
+        # Pushed transport/volume changes; polling remains the fallback
+        self.events = SonosEventListener(
+            hass,
+            self._session,
+            self.async_handle_event,
+            entry.data.get(CONF_EVENT_PORT, DEFAULT_EVENT_PORT),
+        )
+        # Collapse bursts of grouping calls into a single refresh
+        self.group_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=GROUP_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+        self.command_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=COMMAND_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+        # Commanded speakers awaiting a settled state -> follow-up polls made
+        self._settling: dict[str, int] = {}
+        self._settle_unsub: CALLBACK_TYPE | None = None
 
     @property
     def speakers(self) -> dict[str, dict[str, Any]]:
         """Return all discovered speakers."""
         return self._speakers
 
+    def get_device_meta(
+        self, ip: str, speaker_info: dict[str, Any]
+    ) -> tuple[str, DeviceInfo]:
+        """Return the device id and device info for a speaker's entities."""
+        if (meta := self._device_meta.get(ip)) is None:
+            device_id = speaker_info.get("uuid") or speaker_info.get("serial_number") or ip
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=speaker_info.get("zone_name", f"Sonos ({ip})"),
+                manufacturer="Sonos",
+                model=speaker_info.get("model_name", "Unknown"),
+                sw_version=speaker_info.get("software_version"),
+                hw_version=speaker_info.get("hardware_version"),
+                configuration_url=f"http://{ip}:{SONOS_PORT}/",
+            )
+            # Shared by every entity of the speaker, so hand out a read-only view
+            meta = self._device_meta[ip] = (
+                device_id,
+                cast(DeviceInfo, MappingProxyType(device_info)),
+            )
+        return meta
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session for talking to speakers."""
+        return self._session
+
     @property
     def speaker_ips(self) -> list[str]:
         """Return configured speaker IPs."""
@@ -59,120 +183,280 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from all configured Sonos speakers."""
         speakers_data: dict[str, Any] = {}
+        changed_ips: list[str] = []
         
         if not self._speaker_ips:
             _LOGGER.debug("No speaker IPs configured")
             return speakers_data
 
-        connector = aiohttp.TCPConnector(limit=10, force_close=True)
-        
         try:
-            async with aiohttp.ClientSession(connector=connector) as session:
-                tasks = []
-                for ip in self._speaker_ips:
-                    tasks.append(self._update_speaker(session, ip))
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [
+                asyncio.create_task(self._poll_speaker(ip))
+                for ip in self._speaker_ips
+            ]
+            results: dict[str, Any] = {}
+            
+            # Collect speakers as they finish so a straggler hitting the
+            # last-resort guard does not discard everyone else's fresh data
+            try:
+                async with asyncio.timeout(UPDATE_TIMEOUT):
+                    for next_result in asyncio.as_completed(tasks):
+                        ip, result = await next_result
+                        results[ip] = result
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Timed out waiting for %d speakers", len(tasks) - len(results)
+                )
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for ip in self._speaker_ips:
+                result = results.get(ip, asyncio.TimeoutError("update timed out"))
+                if isinstance(result, Exception):
+                    _LOGGER.warning("Error updating speaker %s: %s", ip, result)
+                    invalidate_speaker_info(self.hass, ip)
+                    self._static_info.pop(ip, None)
+                    if ip in self._speakers:
+                        speakers_data[ip] = {**self._speakers[ip], "available": False}
+                elif result:
+                    speakers_data[ip] = result
+                    speakers_data[ip]["available"] = True
+                else:
+                    _LOGGER.warning("Speaker %s not responding", ip)
+                    invalidate_speaker_info(self.hass, ip)
+                    self._static_info.pop(ip, None)
+                    if ip in self._speakers:
+                        speakers_data[ip] = {**self._speakers[ip], "available": False}
                 
-                for ip, result in zip(self._speaker_ips, results):
-                    if isinstance(result, Exception):
-                        _LOGGER.warning("Error updating speaker %s: %s", ip, result)
-                        if ip in self._speakers:
-                            speakers_data[ip] = self._speakers[ip]
-                            speakers_data[ip]["available"] = False
-                    elif result:
-                        speakers_data[ip] = result
-                        speakers_data[ip]["available"] = True
-                    else:
-                        _LOGGER.warning("Speaker %s not responding", ip)
-                        if ip in self._speakers:
-                            speakers_data[ip] = self._speakers[ip]
-                            speakers_data[ip]["available"] = False
+                if ip in speakers_data and self._stamp_version(ip, speakers_data[ip]):
+                    changed_ips.append(ip)
 
         except Exception as err:
             raise UpdateFailed(f"Error communicating with Sonos speakers: {err}") from err
 
         self._speakers = speakers_data
+        self._rebuild_entity_index()
+        self._async_ensure_subscriptions()
+        self._async_schedule_settle_refresh()
+        for ip in changed_ips:
+            self._async_dispatch(ip)
         return speakers_data
 
+    def _stamp_version(self, ip: str, info: dict[str, Any]) -> bool:
+        """Carry over the speaker's data version, bumping it if anything changed.
+
+        Returns True if the data changed.
+        """
+        previous = self._speakers.get(ip)
+        info[DATA_VERSION] = previous.get(DATA_VERSION) if previous else None
+        if info == previous:
+            return False
+        info[DATA_VERSION] = next(self._versions)
+        return True
+
+    @callback
+    def _async_dispatch(self, ip: str) -> None:
+        """Wake only the entities of a speaker whose data changed."""
+        async_dispatcher_send(
+            self.hass, SIGNAL_SPEAKER_UPDATED.format(ip), self._speakers[ip]
+        )
+
+    async def async_start_events(self) -> None:
+        """Start receiving speaker events and subscribe to known speakers."""
+        await self.events.async_start()
+        self._async_ensure_subscriptions()
+
+    @callback
+    def _async_ensure_subscriptions(self) -> None:
+        """Subscribe to events from available speakers lacking a subscription."""
+        for ip, info in self._speakers.items():
+            if info.get("available"):
+                self.events.async_ensure_subscribed(ip)
+
+    @callback
+    def async_handle_event(self, ip: str, changes: dict[str, Any]) -> None:
+        """Apply state pushed by a speaker event."""
+        if not self.data or ip not in self.data:
+            return
+        
+        info = self.data[ip]
+        if all(info.get(key) == value for key, value in changes.items()):
+            return
+        
+        info.update(changes)
+        info[DATA_VERSION] = next(self._versions)
+        self._async_dispatch(ip)
+        self.async_update_listeners()
+
+    async def async_refresh_after_command(self, ip: str) -> None:
+        """Refresh after a command unless the speaker pushes its own changes."""
+        if not self.events.is_live(ip):
+            self._settling[ip] = 0
+            await self.command_refresh.async_call()
+
+    @callback
+    def _async_schedule_settle_refresh(self) -> None:
+        """Poll again shortly if a commanded speaker is still transitioning.
+
+        A single refresh right after a command often catches the speaker
+        mid-transition; follow-up polls back off until it settles.
+        """
+        delay: float | None = None
+        for ip, attempts in list(self._settling.items()):
+            state = self._speakers.get(ip, {}).get("transport_state")
+            if state != "TRANSITIONING" or attempts >= len(SETTLE_REFRESH_DELAYS):
+                del self._settling[ip]
+                continue
+            self._settling[ip] = attempts + 1
+            step = SETTLE_REFRESH_DELAYS[attempts]
+            delay = step if delay is None else min(delay, step)
+        
+        if delay is not None and self._settle_unsub is None:
+            self._settle_unsub = async_call_later(
+                self.hass, delay, self._async_settle_refresh
+            )
+
+    async def _async_settle_refresh(self, _now: Any) -> None:
+        """Run a follow-up poll for transitioning speakers."""
+        self._settle_unsub = None
+        await self.async_refresh()
+
+    @callback
+    def async_cancel_settle_refresh(self) -> None:
+        """Cancel any pending follow-up poll."""
+        self._settling.clear()
+        if self._settle_unsub is not None:
+            self._settle_unsub()
+            self._settle_unsub = None
+
+    async def _poll_speaker(self, ip: str) -> tuple[str, Any]:
+        """Update a single speaker, returning its IP with the result or error."""
+        try:
+            return ip, await self._update_speaker(self._session, ip)
+        except Exception as err:  # pylint: disable=broad-except
+            return ip, err
+
     async def _update_speaker(
         self,
         session: aiohttp.ClientSession,
         ip: str,
     ) -> dict[str, Any] | None:
         """Update data for a single speaker."""
-        speaker_info = await get_speaker_info(session, ip, timeout=5)
-        
-        if not speaker_info:
-            return None
-        
-        # Fetch all additional data in parallel
-        transport_task = self._get_transport_info(ip)
-        position_task = self._get_position_info(ip)
-        volume_task = self._get_volume_info(ip)
-        eq_task = self._get_eq_info(ip)
-        device_settings_task = self._get_device_settings(ip)
-        zone_group_task = self._get_zone_group_info(ip)
-        
-        results = await asyncio.gather(
-            transport_task,
-            position_task,
-            volume_task,
-            eq_task,
-            device_settings_task,
-            zone_group_task,
-            return_exceptions=True,
+        fetchers = (
+            self._get_transport_info,
+            self._get_position_info,
+            self._get_rendering_info,
+            self._get_device_settings,
+            self._get_zone_group_info,
         )
         
+        cached = self._static_info.get(ip)
+        if cached and time.monotonic() - cached[0] < STATIC_INFO_MAX_AGE:
+            # Device info is still fresh; only poll the changing state
+            results = await asyncio.gather(
+                *(fetch(ip) for fetch in fetchers),
+                return_exceptions=True,
+            )
+            # A responsive speaker always answers the transport queries
+            if not isinstance(results[0], dict) or not results[0]:
+                return None
+            speaker_info = dict(cached[1])
+        elif not self._speakers.get(ip, {}).get("available"):
+            # Confirm an unknown or offline speaker answers before polling state
+            speaker_info = await get_speaker_info(session, ip, timeout=5)
+            if not speaker_info:
+                return None
+            self._static_info[ip] = (time.monotonic(), dict(speaker_info))
+            results = await asyncio.gather(
+                *(fetch(ip) for fetch in fetchers),
+                return_exceptions=True,
+            )
+        else:
+            # Known-good speaker: fetch device info and all state at once
+            info_result, *results = await asyncio.gather(
+                get_speaker_info(session, ip, timeout=5),
+                *(fetch(ip) for fetch in fetchers),
+                return_exceptions=True,
+            )
+            if not isinstance(info_result, dict) or not info_result:
+                return None
+            speaker_info = info_result
+            self._static_info[ip] = (time.monotonic(), dict(speaker_info))
+        
         for result in results:
             if isinstance(result, dict):
                 speaker_info.update(result)
         
         return speaker_info
 
+    async def _send(
+        self,
+        ip: str,
+        service: str,
+        action: str,
+        arguments: str,
+        control_url: str,
+    ) -> tuple[bool, str]:
+        """Send a poll query over the shared session.
+
+        send_upnp_command shields the request itself, so a cancelled poll
+        still lets it finish and hand its pooled connection back for reuse.
+        """
+        return await send_upnp_command(
+            ip,
+            service,
+            action,
+            arguments,
+            control_url,
+            session=self._session,
+        )
+
+    async def _query_all(
+        self,
+        ip: str,
+        service: str,
+        control_url: str,
+        *queries: tuple[str, str],
+    ) -> list[tuple[bool, str]]:
+        """Send independent (action, arguments) queries to one service at once."""
+        return await asyncio.gather(
+            *(
+                self._send(ip, service, action, arguments, control_url)
+                for action, arguments in queries
+            )
+        )
+
     async def _get_transport_info(self, ip: str) -> dict[str, Any]:
         """Get transport info (play state, shuffle, repeat)."""
         data = {}
         
-        # Get transport info
-        success, response = await send_upnp_command(
+        # Transport info, transport settings (shuffle, repeat) and crossfade
+        transport, settings, crossfade = await self._query_all(
             ip,
             UPNP_AV_TRANSPORT,
-            "GetTransportInfo",
-            "<InstanceID>0</InstanceID>",
             CONTROL_AV_TRANSPORT,
+            ("GetTransportInfo", "<InstanceID>0</InstanceID>"),
+            ("GetTransportSettings", "<InstanceID>0</InstanceID>"),
+            ("GetCrossfadeMode", "<InstanceID>0</InstanceID>"),
         )
         
+        success, response = transport
         if success:
-            data["transport_state"] = extract_xml_value(response, "CurrentTransportState") or "STOPPED"
-            data["transport_status"] = extract_xml_value(response, "CurrentTransportStatus")
-        
-        # Get transport settings (shuffle, repeat)
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_AV_TRANSPORT,
-            "GetTransportSettings",
-            "<InstanceID>0</InstanceID>",
-            CONTROL_AV_TRANSPORT,
-        )
+            values = parse_xml_values(response)
+            data["transport_state"] = (values.get("CurrentTransportState") or "STOPPED").upper()
+            data["transport_status"] = values.get("CurrentTransportStatus")
         
+        success, response = settings
         if success:
-            play_mode = extract_xml_value(response, "PlayMode") or "NORMAL"
-            data["shuffle"] = "SHUFFLE" in play_mode
-            data["repeat"] = "REPEAT" in play_mode
-            data["repeat_one"] = play_mode == "REPEAT_ONE"
-        
-        # Get crossfade mode
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_AV_TRANSPORT,
-            "GetCrossfadeMode",
-            "<InstanceID>0</InstanceID>",
-            CONTROL_AV_TRANSPORT,
-        )
+            values = parse_xml_values(response)
+            data.update(parse_play_mode(values.get("PlayMode") or "NORMAL"))
         
+        success, response = crossfade
         if success:
-            data["crossfade"] = extract_xml_value_bool(response, "CrossfadeMode")
+            values = parse_xml_values(response)
+            data["crossfade"] = soap_value_bool(values, "CrossfadeMode")
         
         return data
 
@@ -180,7 +464,7 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Get current track position info."""
         data = {}
         
-        success, response = await send_upnp_command(
+        success, response = await self._send(
             ip,
             UPNP_AV_TRANSPORT,
             "GetPositionInfo",
@@ -189,14 +473,15 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         
         if success:
-            data["track_number"] = extract_xml_value_int(response, "Track")
-            data["track_duration"] = parse_duration(extract_xml_value(response, "TrackDuration") or "")
-            data["track_position"] = parse_duration(extract_xml_value(response, "RelTime") or "")
-            track_uri = extract_xml_value(response, "TrackURI") or ""
+            values = parse_xml_values(response)
+            data["track_number"] = soap_value_int(values, "Track")
+            data["track_duration"] = parse_duration(values.get("TrackDuration") or "")
+            data["track_position"] = parse_duration(values.get("RelTime") or "")
+            track_uri = values.get("TrackURI") or ""
             data["track_uri"] = track_uri
             
             # Parse track metadata
-            metadata_raw = extract_xml_value(response, "TrackMetaData")
+            metadata_raw = values.get("TrackMetaData")
             if metadata_raw:
                 metadata = parse_didl_metadata(metadata_raw)
                 data["track_title"] = metadata.get("title")
@@ -207,7 +492,7 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Fallback: If no title and it's a stream, try to get stream info
                 if not data.get("track_title") and ("http" in track_uri or "x-rincon-mp3radio" in track_uri or "x-sonosapi-stream" in track_uri):
                     # For streaming services, try additional fields
-                    stream_info = extract_xml_value(response, "StreamContent") or metadata.get("stream_content")
+                    stream_info = values.get("StreamContent") or metadata.get("stream_content")
                     if stream_info:
                         data["track_title"] = stream_info
                     
@@ -218,159 +503,137 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         return data
 
-    async def _get_volume_info(self, ip: str) -> dict[str, Any]:
-        """Get volume and mute status."""
+    async def _get_rendering_info(self, ip: str) -> dict[str, Any]:
+        """Get volume, mute and EQ settings (bass, treble, loudness, etc.)."""
         data = {}
         
-        # Get volume
-        success, response = await send_upnp_command(
+        # Night mode and speech enhancement are soundbar-only and may fail
+        (
+            volume,
+            mute,
+            bass,
+            treble,
+            loudness,
+            night_mode,
+            speech,
+        ) = await self._query_all(
             ip,
             UPNP_RENDERING_CONTROL,
-            "GetVolume",
-            "<InstanceID>0</InstanceID><Channel>Master</Channel>",
             CONTROL_RENDERING,
+            ("GetVolume", "<InstanceID>0</InstanceID><Channel>Master</Channel>"),
+            ("GetMute", "<InstanceID>0</InstanceID><Channel>Master</Channel>"),
+            ("GetBass", "<InstanceID>0</InstanceID>"),
+            ("GetTreble", "<InstanceID>0</InstanceID>"),
+            ("GetLoudness", "<InstanceID>0</InstanceID><Channel>Master</Channel>"),
+            ("GetEQ", "<InstanceID>0</InstanceID><EQType>NightMode</EQType>"),
+            ("GetEQ", "<InstanceID>0</InstanceID><EQType>DialogLevel</EQType>"),
         )
         
+        success, response = volume
         if success:
-            data["volume"] = extract_xml_value_int(response, "CurrentVolume")
-        
-        # Get mute
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_RENDERING_CONTROL,
-            "GetMute",
-            "<InstanceID>0</InstanceID><Channel>Master</Channel>",
-            CONTROL_RENDERING,
-        )
+            values = parse_xml_values(response)
+            data["volume"] = soap_value_int(values, "CurrentVolume")
         
+        success, response = mute
         if success:
-            data["mute"] = extract_xml_value_bool(response, "CurrentMute")
-        
-        return data
-
-    async def _get_eq_info(self, ip: str) -> dict[str, Any]:
-        """Get EQ settings (bass, treble, loudness, etc.)."""
-        data = {}
+            values = parse_xml_values(response)
+            data["mute"] = soap_value_bool(values, "CurrentMute")
         
-        # Get bass
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_RENDERING_CONTROL,
-            "GetBass",
-            "<InstanceID>0</InstanceID>",
-            CONTROL_RENDERING,
-        )
+        success, response = bass
         if success:
-            data["bass"] = extract_xml_value_int(response, "CurrentBass")
+            values = parse_xml_values(response)
+            data["bass"] = soap_value_int(values, "CurrentBass")
         
-        # Get treble
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_RENDERING_CONTROL,
-            "GetTreble",
-            "<InstanceID>0</InstanceID>",
-            CONTROL_RENDERING,
-        )
+        success, response = treble
         if success:
-            data["treble"] = extract_xml_value_int(response, "CurrentTreble")
+            values = parse_xml_values(response)
+            data["treble"] = soap_value_int(values, "CurrentTreble")
         
-        # Get loudness
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_RENDERING_CONTROL,
-            "GetLoudness",
-            "<InstanceID>0</InstanceID><Channel>Master</Channel>",
-            CONTROL_RENDERING,
-        )
+        success, response = loudness
         if success:
-            data["loudness"] = extract_xml_value_bool(response, "CurrentLoudness")
+            values = parse_xml_values(response)
+            data["loudness"] = soap_value_bool(values, "CurrentLoudness")
         
-        # Get night mode (soundbars only - may fail on other devices)
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_RENDERING_CONTROL,
-            "GetEQ",
-            "<InstanceID>0</InstanceID><EQType>NightMode</EQType>",
-            CONTROL_RENDERING,
-        )
+        success, response = night_mode
         if success:
-            data["night_mode"] = extract_xml_value_bool(response, "CurrentValue")
+            values = parse_xml_values(response)
+            data["night_mode"] = soap_value_bool(values, "CurrentValue")
         
-        # Get speech enhancement (soundbars only)
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_RENDERING_CONTROL,
-            "GetEQ",
-            "<InstanceID>0</InstanceID><EQType>DialogLevel</EQType>",
-            CONTROL_RENDERING,
-        )
+        success, response = speech
         if success:
-            data["speech_enhancement"] = extract_xml_value_bool(response, "CurrentValue")
+            values = parse_xml_values(response)
+            data["speech_enhancement"] = soap_value_bool(values, "CurrentValue")
         
         return data
 
     async def _get_device_settings(self, ip: str) -> dict[str, Any]:
-        """Get device settings (LED, touch controls, etc.)."""
+        """Get device settings (LED, touch controls, room name)."""
         data = {}
         
-        # Get LED state
-        success, response = await send_upnp_command(
+        led, button_lock, zone = await self._query_all(
             ip,
             UPNP_DEVICE_PROPERTIES,
-            "GetLEDState",
-            "",
             CONTROL_DEVICE_PROPERTIES,
+            ("GetLEDState", ""),
+            ("GetButtonLockState", ""),
+            ("GetZoneAttributes", ""),
         )
+        
+        # Rooms can be renamed at any time, so this is not cached with device info
+        success, response = zone
+        if success and (zone_name := parse_xml_values(response).get("CurrentZoneName")):
+            data["zone_name"] = zone_name
+        
+        success, response = led
         if success:
-            led_state = extract_xml_value(response, "CurrentLEDState")
+            values = parse_xml_values(response)
+            led_state = values.get("CurrentLEDState")
             data["status_light"] = led_state == "On" if led_state else True
         
-        # Get button lock state (touch controls)
-        success, response = await send_upnp_command(
-            ip,
-            UPNP_DEVICE_PROPERTIES,
-            "GetButtonLockState",
-            "",
-            CONTROL_DEVICE_PROPERTIES,
-        )
+        # Button lock state (touch controls)
+        success, response = button_lock
         if success:
-            lock_state = extract_xml_value(response, "CurrentButtonLockState")
+            values = parse_xml_values(response)
+            lock_state = values.get("CurrentButtonLockState")
             data["touch_controls"] = lock_state != "On" if lock_state else True
         
         return data
 
     async def async_add_speaker(self, ip: str, speaker_info: dict[str, Any]) -> None:
         """Add a new speaker to the coordinator."""
-        if ip not in self._speaker_ips:
-            self._speaker_ips.append(ip)
-            self._speakers[ip] = speaker_info
-            
-            new_data = dict(self.entry.data)
-            new_data[CONF_SPEAKER_IPS] = self._speaker_ips
-            self.hass.config_entries.async_update_entry(self.entry, data=new_data)
-            
-            await self.async_request_refresh()
+        await self.async_add_speakers({ip: speaker_info})
+
+    async def async_add_speakers(self, speakers: dict[str, dict[str, Any]]) -> None:
+        """Add several speakers with a single entry update.
+
+        The entry's update listener reloads it, so every platform creates
+        entities for the new speakers.
+        """
+        new_ips = [ip for ip in speakers if ip not in self._speaker_ips]
+        if not new_ips:
+            return
+        
+        new_data = dict(self.entry.data)
+        new_data[CONF_SPEAKER_IPS] = [*self._speaker_ips, *new_ips]
+        self.hass.config_entries.async_update_entry(self.entry, data=new_data)
 
     async def async_remove_speaker(self, ip: str) -> None:
-        """Remove a speaker from the coordinator."""
+        """Remove a speaker; the entry reload drops its entities."""
         if ip in self._speaker_ips:
-            self._speaker_ips.remove(ip)
-            self._speakers.pop(ip, None)
-            
             new_data = dict(self.entry.data)
-            new_data[CONF_SPEAKER_IPS] = self._speaker_ips
+            new_data[CONF_SPEAKER_IPS] = [other for other in self._speaker_ips if other != ip]
             self.hass.config_entries.async_update_entry(self.entry, data=new_data)
 
     async def _get_zone_group_info(self, ip: str) -> dict[str, Any]:
         """Get zone group topology to detect grouping."""
         data = {"group_members": [], "is_coordinator": True}
         
-        success, response = await send_upnp_command(
+        success, response = await self._send(
             ip,
-            "urn:schemas-upnp-org:service:ZoneGroupTopology:1",
+            UPNP_ZONE_GROUP_TOPOLOGY,
             "GetZoneGroupState",
             "",
-            "/ZoneGroupTopology/Control",
+            CONTROL_ZONE_GROUP,
         )
         
         if not success:
@@ -378,8 +641,6 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return data
         
         try:
-            import re
-            
             # Get this speaker's UUID
             speaker_uuid = None
             for speaker_ip, speaker_info in self._speakers.items():
@@ -391,32 +652,30 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.debug("No UUID found for speaker %s", ip)
                 return data
             
-            # Extract ZoneGroupState
-            state_match = re.search(r'<ZoneGroupState>(.*?)</ZoneGroupState>', response, re.DOTALL)
-            if not state_match:
+            # Extract ZoneGroupState (already unescaped by the SOAP parser)
+            zone_state = parse_xml_values(
+                response, ("ZoneGroupState",)
+            ).get("ZoneGroupState")
+            if not zone_state:
                 _LOGGER.debug("No ZoneGroupState found in response for %s", ip)
                 return data
             
-            zone_state = state_match.group(1)
-            # Unescape XML entities
-            zone_state = zone_state.replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"').replace("&amp;", "&")
-            
             _LOGGER.debug("Zone state for %s: %s", ip, zone_state[:500])
             
             # Find all ZoneGroups
-            zone_groups = re.findall(r'<ZoneGroup([^>]*)>(.*?)</ZoneGroup>', zone_state, re.DOTALL)
-            
-            for group_attrs, group_content in zone_groups:
+            for group in ElementTree.fromstring(zone_state).iter("ZoneGroup"):
                 # Get coordinator UUID from ZoneGroup attributes
-                coordinator_match = re.search(r'Coordinator="([^"]+)"', group_attrs)
-                if not coordinator_match:
+                coordinator_uuid = group.get("Coordinator")
+                if not coordinator_uuid:
                     continue
                 
-                coordinator_uuid = coordinator_match.group(1)
-                
                 # Get all members in this group
-                member_pattern = r'<ZoneGroupMember[^>]*UUID="([^"]+)"[^>]*Location="http://([^:]+):'
-                members = re.findall(member_pattern, group_content)
+                members = []
+                for member in group.iter("ZoneGroupMember"):
+                    member_uuid = member.get("UUID")
+                    member_ip = urlparse(member.get("Location", "")).hostname
+                    if member_uuid and member_ip:
+                        members.append((member_uuid, member_ip))
                 
                 _LOGGER.debug("Found group with coordinator %s, members: %s", coordinator_uuid, members)
                 
@@ -442,12 +701,87 @@ class SonosSubnetCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         return data
 
+    @callback
+    def async_apply_join(self, ip: str, master_ip: str) -> None:
+        """Optimistically add a speaker to its master's group after a confirmed join.
+
+        Only applied when both speakers belong to this coordinator; otherwise
+        the caller's group refresh picks up the change.
+        """
+        if not self.data or ip not in self.data or master_ip not in self.data:
+            return
+
+        changed_ips = self._async_remove_from_groups(ip)
+        members = list(self.data[master_ip].get("group_members") or [master_ip])
+        if ip not in members:
+            members.append(ip)
+        for member_ip in members:
+            if member_ip in self.data:
+                self.data[member_ip]["group_members"] = members
+                self.data[member_ip][DATA_VERSION] = next(self._versions)
+                changed_ips.add(member_ip)
+        self.data[ip]["is_coordinator"] = False
+        self._async_publish_group_change(changed_ips)
+
+    @callback
+    def async_apply_unjoin(self, ip: str) -> None:
+        """Optimistically make a speaker standalone after a confirmed unjoin."""
+        if not self.data or ip not in self.data:
+            return
+
+        changed_ips = self._async_remove_from_groups(ip)
+        self.data[ip]["group_members"] = [ip]
+        self.data[ip]["is_coordinator"] = True
+        self.data[ip][DATA_VERSION] = next(self._versions)
+        self._async_publish_group_change(changed_ips)
+
+    @callback
+    def _async_remove_from_groups(self, ip: str) -> set[str]:
+        """Drop a speaker from whatever group it was in; return touched IPs."""
+        changed_ips = {ip}
+        for speaker_ip, info in self.data.items():
+            members = info.get("group_members") or []
+            if speaker_ip != ip and ip in members:
+                info["group_members"] = [m for m in members if m != ip]
+                info[DATA_VERSION] = next(self._versions)
+                changed_ips.add(speaker_ip)
+        return changed_ips
+
+    @callback
+    def _async_publish_group_change(self, changed_ips: set[str]) -> None:
+        """Wake the entities of speakers whose grouping changed."""
+        for changed_ip in changed_ips:
+            self._async_dispatch(changed_ip)
+        self.async_set_updated_data(self.data)
+
+    def _rebuild_entity_index(self) -> None:
+        """Rebuild the entity_id <-> IP indexes from current speaker zone names."""
+        entity_to_ip: dict[str, str] = {}
+        ip_to_entity: dict[str, str] = {}
+        for ip, info in self._speakers.items():
+            zone_name = info.get("zone_name")
+            if not zone_name:
+                continue
+            # Create entity_id from zone_name; first speaker wins on duplicates
+            entity_id = f"media_player.{zone_name.lower().replace(' ', '_')}"
+            entity_to_ip.setdefault(entity_id, ip)
+            ip_to_entity[ip] = entity_id
+        
+        if ip_to_entity != self._ip_to_entity:
+            self._entity_index_version += 1
+        self._entity_to_ip = entity_to_ip
+        self._ip_to_entity = ip_to_entity
+
+    @property
+    def entity_index_version(self) -> int:
+        """Return a counter that changes whenever the IP -> entity_id index does."""
+        return self._entity_index_version
+
     def get_ip_from_entity_id(self, entity_id: str) -> str | None:
         """Convert entity_id to IP address."""
-        for ip, info in self._speakers.items():
-            zone_name = info.get("zone_name", "")
-            # Create entity_id from zone_name
-            expected_id = f"media_player.{zone_name.lower().replace(' ', '_')}"
-            if expected_id == entity_id:
-                return ip
-        return None
+        return self._entity_to_ip.get(entity_id)
+
+    def get_entity_ids_from_ips(self, ips: list[str]) -> list[str]:
+        """Convert IP addresses to expected entity_ids, skipping unknown ones."""
+        ip_to_entity = self._ip_to_entity
+        return [ip_to_entity[ip] for ip in ips if ip in ip_to_entity]
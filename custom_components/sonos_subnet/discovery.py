@@ -4,47 +4,115 @@ from __future__ import annotations
 import asyncio
 import logging
 import socket
+import time
 from typing import Any
 from ipaddress import IPv4Network, IPv4Address
+from urllib.parse import urlparse
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant
 
-from .const import SONOS_PORT, SCAN_BATCH_SIZE, DEFAULT_SCAN_TIMEOUT
+from .const import (
+    DOMAIN,
+    SONOS_PORT,
+    SCAN_BATCH_SIZE,
+    SCAN_CONNECT_TIMEOUT,
+    DEFAULT_SCAN_TIMEOUT,
+)
+from .helpers import client_timeout, parse_xml_values
 
 _LOGGER = logging.getLogger(__name__)
 
 # Sonos device description URL
 DEVICE_DESCRIPTION_PATH = "/xml/device_description.xml"
 
+# Recently validated speakers, shared by config flows and services
+VALIDATION_CACHE_KEY = f"{DOMAIN}_validation_cache"
+VALIDATION_CACHE_TTL = 60
 
-async def check_sonos_device(
-    session: aiohttp.ClientSession,
-    ip: str,
-    timeout: int = DEFAULT_SCAN_TIMEOUT,
-) -> dict[str, Any] | None:
-    """Check if a Sonos device exists at the given IP address."""
-    url = f"http://{ip}:{SONOS_PORT}{DEVICE_DESCRIPTION_PATH}"
+# SSDP discovery settings
+SSDP_ADDR = "239.255.255.250"
+SSDP_PORT = 1900
+SSDP_MX = 1
+SSDP_TTL = 4
+SSDP_ST = "urn:schemas-upnp-org:device:ZonePlayer:1"
+SSDP_SEARCH = (
+    "M-SEARCH * HTTP/1.1\r\n"
+    f"HOST: {SSDP_ADDR}:{SSDP_PORT}\r\n"
+    'MAN: "ssdp:discover"\r\n'
+    f"MX: {SSDP_MX}\r\n"
+    f"ST: {SSDP_ST}\r\n"
+    "\r\n"
+).encode("ascii")
+
+
+class _SSDPResponseProtocol(asyncio.DatagramProtocol):
+    """Collect LOCATION headers from SSDP search responses."""
+
+    def __init__(self) -> None:
+        """Initialize the protocol."""
+        self.locations: set[str] = set()
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Handle an SSDP response datagram."""
+        for line in data.decode("utf-8", errors="ignore").splitlines():
+            key, _, value = line.partition(":")
+            if key.strip().lower() == "location" and value.strip():
+                self.locations.add(value.strip())
+
+
+async def ssdp_discover_sonos(network: IPv4Network, mx: int = SSDP_MX) -> set[str]:
+    """Send an SSDP M-SEARCH and return responding Sonos IPs within network.
+
+    Only works where multicast reaches the target subnet (routed multicast
+    or a reflector); returns an empty set otherwise.
+    """
+    loop = asyncio.get_running_loop()
     
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-            if response.status == 200:
-                text = await response.text()
-                if "Sonos" in text or "sonos" in text.lower():
-                    return await get_speaker_info(session, ip, timeout)
-    except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
-        pass
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, SSDP_TTL)
+        sock.setblocking(False)
+        sock.bind(("", 0))
+        transport, protocol = await loop.create_datagram_endpoint(
+            _SSDPResponseProtocol, sock=sock
+        )
+    except OSError as err:
+        _LOGGER.debug("SSDP discovery unavailable: %s", err)
+        return set()
     
-    return None
+    try:
+        # Send twice since UDP may drop the first datagram
+        for _ in range(2):
+            transport.sendto(SSDP_SEARCH, (SSDP_ADDR, SSDP_PORT))
+        await asyncio.sleep(mx + 0.5)
+    except OSError as err:
+        _LOGGER.debug("SSDP M-SEARCH failed: %s", err)
+    finally:
+        transport.close()
+    
+    found_ips: set[str] = set()
+    for location in protocol.locations:
+        host = urlparse(location).hostname
+        try:
+            if host and IPv4Address(host) in network:
+                found_ips.add(host)
+        except ValueError:
+            continue
+    
+    return found_ips
 
 
 async def get_speaker_info(
     session: aiohttp.ClientSession,
     ip: str,
-    timeout: int = DEFAULT_SCAN_TIMEOUT,
+    timeout: float = DEFAULT_SCAN_TIMEOUT,
 ) -> dict[str, Any] | None:
-    """Get detailed information about a Sonos speaker."""
+    """Get detailed information about a Sonos speaker.
+
+    Returns None if the device at the address is not a Sonos speaker.
+    """
     try:
         # Try to get device info from Sonos HTTP API
         status_url = f"http://{ip}:{SONOS_PORT}/status/zp"
@@ -57,31 +125,43 @@ async def get_speaker_info(
         
         # Get zone player status
         try:
-            async with session.get(status_url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            async with session.get(status_url, timeout=client_timeout(timeout)) as response:
                 if response.status == 200:
-                    text = await response.text()
-                    # Parse basic info from status
+                    # Drain the body so the connection can be reused
+                    await response.read()
                     speaker_info["status_available"] = True
         except (aiohttp.ClientError, asyncio.TimeoutError):
             speaker_info["status_available"] = False
         
         # Get device description
-        async with session.get(info_url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        async with session.get(info_url, timeout=client_timeout(timeout)) as response:
             if response.status == 200:
-                text = await response.text()
+                # Parse the raw bytes directly; ElementTree handles decoding
+                raw = await response.read()
+                values = {
+                    tag: value
+                    for tag, value in parse_xml_values(raw).items()
+                    if value
+                }
                 
-                # Parse XML for device info (simple parsing)
-                speaker_info["zone_name"] = _extract_xml_value(text, "roomName") or _extract_xml_value(text, "friendlyName") or f"Sonos ({ip})"
-                speaker_info["model_name"] = _extract_xml_value(text, "modelName") or "Unknown"
-                speaker_info["model_number"] = _extract_xml_value(text, "modelNumber") or "Unknown"
-                speaker_info["serial_number"] = _extract_xml_value(text, "serialNum") or _extract_xml_value(text, "serialNumber")
-                speaker_info["software_version"] = _extract_xml_value(text, "softwareVersion") or _extract_xml_value(text, "swGen")
-                speaker_info["hardware_version"] = _extract_xml_value(text, "hardwareVersion")
-                speaker_info["mac_address"] = _extract_xml_value(text, "MACAddress")
-                speaker_info["household_id"] = _extract_xml_value(text, "householdId")
+                # Anything else answering on the Sonos port is not a speaker
+                if (
+                    "Sonos" not in values.get("manufacturer", "")
+                    and "Sonos" not in values.get("modelName", "")
+                ):
+                    return None
+                
+                speaker_info["zone_name"] = values.get("roomName") or values.get("friendlyName") or f"Sonos ({ip})"
+                speaker_info["model_name"] = values.get("modelName") or "Unknown"
+                speaker_info["model_number"] = values.get("modelNumber") or "Unknown"
+                speaker_info["serial_number"] = values.get("serialNum") or values.get("serialNumber")
+                speaker_info["software_version"] = values.get("softwareVersion") or values.get("swGen")
+                speaker_info["hardware_version"] = values.get("hardwareVersion")
+                speaker_info["mac_address"] = values.get("MACAddress")
+                speaker_info["household_id"] = values.get("householdId")
                 
                 # Extract UDN for unique identification
-                udn = _extract_xml_value(text, "UDN")
+                udn = values.get("UDN")
                 if udn:
                     speaker_info["udn"] = udn
                     # Clean up UUID format
@@ -98,30 +178,21 @@ async def get_speaker_info(
     return None
 
 
-def _extract_xml_value(xml_text: str, tag: str) -> str | None:
-    """Extract a value from XML text (simple extraction without full parsing)."""
-    import re
-    
-    # Try different patterns for the tag
-    patterns = [
-        rf"<{tag}>([^<]+)</{tag}>",
-        rf"<{tag}[^>]*>([^<]+)</{tag}>",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, xml_text, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-    
-    return None
-
-
 async def scan_subnet_for_sonos(
     hass: HomeAssistant,
     subnet: str,
     timeout: int = DEFAULT_SCAN_TIMEOUT,
+    stop_on_count: int | None = None,
 ) -> list[dict[str, Any]]:
-    """Scan a subnet for Sonos devices."""
+    """Scan a subnet for Sonos devices.
+
+    Every host address is probed with a TCP connect to the Sonos port and
+    only hosts that accept are queried over HTTP. An SSDP multicast search
+    runs alongside; devices that answer it are queried straight away,
+    ahead of the sweep and without the connect check. Devices are collected
+    as soon as they answer. If stop_on_count is given, the scan stops once
+    that many devices have been found.
+    """
     discovered_devices: list[dict[str, Any]] = []
     
     try:
@@ -130,40 +201,107 @@ async def scan_subnet_for_sonos(
         _LOGGER.error("Invalid subnet format %s: %s", subnet, err)
         return []
     
-    # Get all host IPs in the network
+    # Multicast rarely crosses subnets, so sweep every host while SSDP listens
+    # rather than waiting out its MX window first
     all_ips = [str(ip) for ip in network.hosts()]
-    
     _LOGGER.info("Scanning %d IP addresses in subnet %s", len(all_ips), subnet)
+    # Addresses already queried over HTTP, by the sweep or after an SSDP answer
+    queried: set[str] = set()
+    
+    # Keep-alive lets the follow-up info requests to a found speaker reuse
+    # the probe's connection; concurrency is gated by the semaphore instead
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=1,
+        enable_cleanup_closed=True,
+    )
+    # Limit in-flight probes to bound open sockets
+    semaphore = asyncio.Semaphore(SCAN_BATCH_SIZE)
+    connect_timeout = min(SCAN_CONNECT_TIMEOUT, timeout)
     
-    # Use connection pooling for efficiency
-    connector = aiohttp.TCPConnector(limit=SCAN_BATCH_SIZE, force_close=True)
+    async def _probe(session: aiohttp.ClientSession, ip: str) -> dict[str, Any] | None:
+        async with semaphore:
+            # SSDP responders are queried as soon as they answer
+            if ip in queried:
+                return None
+            # A bare TCP connect weeds out empty addresses far faster than HTTP
+            if not await quick_ping_check(ip, SONOS_PORT, connect_timeout) or ip in queried:
+                return None
+            queried.add(ip)
+            return await get_speaker_info(session, ip, timeout)
     
+    ssdp_task = asyncio.create_task(ssdp_discover_sonos(network))
     async with aiohttp.ClientSession(connector=connector) as session:
-        # Scan in batches to avoid overwhelming the network
-        for i in range(0, len(all_ips), SCAN_BATCH_SIZE):
-            batch = all_ips[i:i + SCAN_BATCH_SIZE]
-            
-            tasks = [
-                check_sonos_device(session, ip, timeout)
-                for ip in batch
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for ip, result in zip(batch, results):
-                if isinstance(result, dict) and result:
-                    _LOGGER.info("Found Sonos device at %s: %s", ip, result.get("zone_name", "Unknown"))
-                    discovered_devices.append(result)
+        pending: set[asyncio.Task[Any]] = {
+            asyncio.create_task(_probe(session, ip)) for ip in all_ips
+        }
+        pending.add(ssdp_task)
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    
+                    if task is ssdp_task:
+                        if found := task.result() - queried:
+                            _LOGGER.info("SSDP found %d candidate devices in subnet %s", len(found), subnet)
+                            queried.update(found)
+                            pending.update(
+                                asyncio.create_task(get_speaker_info(session, ip, timeout))
+                                for ip in found
+                            )
+                        continue
+                    
+                    if result := task.result():
+                        _LOGGER.info("Found Sonos device at %s: %s", result["ip_address"], result.get("zone_name", "Unknown"))
+                        discovered_devices.append(result)
+                        cache_speaker_info(hass, result)
+                
+                if stop_on_count and len(discovered_devices) >= stop_on_count:
+                    _LOGGER.debug("Found %d expected devices, stopping scan early", stop_on_count)
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
     
+    # Keep results in address order regardless of response order
+    discovered_devices.sort(key=lambda device: IPv4Address(device["ip_address"]))
     return discovered_devices
 
 
+def _get_validation_cache(hass: HomeAssistant) -> dict[str, tuple[float, dict[str, Any]]]:
+    """Return the per-instance cache of validated speaker info."""
+    return hass.data.setdefault(VALIDATION_CACHE_KEY, {})
+
+
+def cache_speaker_info(hass: HomeAssistant, speaker_info: dict[str, Any]) -> None:
+    """Remember speaker info that was just fetched from a device."""
+    _get_validation_cache(hass)[speaker_info["ip_address"]] = (
+        time.monotonic(),
+        dict(speaker_info),
+    )
+
+
+def invalidate_speaker_info(hass: HomeAssistant, ip_address: str) -> None:
+    """Forget cached speaker info, e.g. when the speaker stops responding."""
+    _get_validation_cache(hass).pop(ip_address, None)
+
+
 async def validate_sonos_ip(
     hass: HomeAssistant,
     ip_address: str,
-    timeout: int = DEFAULT_SCAN_TIMEOUT,
+    timeout: float = DEFAULT_SCAN_TIMEOUT,
+    session: aiohttp.ClientSession | None = None,
 ) -> dict[str, Any] | None:
-    """Validate that a Sonos device exists at the given IP."""
+    """Validate that a Sonos device exists at the given IP.
+
+    Results seen within the last VALIDATION_CACHE_TTL seconds are reused.
+    """
     try:
         # Validate IP format
         IPv4Address(ip_address)
@@ -171,8 +309,22 @@ async def validate_sonos_ip(
         _LOGGER.error("Invalid IP address format: %s", ip_address)
         return None
     
-    async with aiohttp.ClientSession() as session:
-        return await get_speaker_info(session, ip_address, timeout)
+    cached = _get_validation_cache(hass).get(ip_address)
+    if cached and time.monotonic() - cached[0] < VALIDATION_CACHE_TTL:
+        _LOGGER.debug("Using cached speaker info for %s", ip_address)
+        return dict(cached[1])
+    
+    if session is not None:
+        speaker_info = await get_speaker_info(session, ip_address, timeout)
+    else:
+        async with aiohttp.ClientSession() as own_session:
+            speaker_info = await get_speaker_info(own_session, ip_address, timeout)
+    
+    if speaker_info:
+        cache_speaker_info(hass, speaker_info)
+    else:
+        invalidate_speaker_info(hass, ip_address)
+    return speaker_info
 
 
 async def quick_ping_check(ip: str, port: int = SONOS_PORT, timeout: float = 1.0) -> bool:
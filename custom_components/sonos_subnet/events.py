@@ -0,0 +1,382 @@
+"""UPnP event subscriptions for Sonos Subnet Discovery."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from functools import partial
+import logging
+import socket
+import time
+from typing import Any, Final
+from xml.etree import ElementTree
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import SONOS_PORT
+from .helpers import (
+    client_timeout,
+    parse_didl_metadata,
+    parse_duration,
+    parse_play_mode,
+    parse_xml_values,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Services whose LastChange events mirror the polled transport and volume state
+EVENT_PATHS: Final = (
+    "/MediaRenderer/AVTransport/Event",
+    "/MediaRenderer/RenderingControl/Event",
+)
+NOTIFY_PATH: Final = "/notify"
+
+SUBSCRIPTION_TIMEOUT: Final = 1800
+# Renew this many seconds before the speaker would drop the subscription
+RENEW_MARGIN: Final = 60
+SUBSCRIBE_REQUEST_TIMEOUT: Final = 5
+# Speakers NOTIFY right after SUBSCRIBE; silence past this means callbacks are blocked
+FIRST_NOTIFY_TIMEOUT: Final = 15
+# How long to stay on polling before subscribing to a silent speaker again
+UNREACHABLE_RETRY: Final = 1800
+
+
+def _to_bool(value: str) -> bool:
+    """Convert a LastChange value to a boolean."""
+    return value.lower() in ("1", "true", "on")
+
+
+def _to_int(value: str) -> int | None:
+    """Convert a LastChange value to an integer."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+# LastChange variable -> (speaker data key, converter)
+LAST_CHANGE_FIELDS: Final[dict[str, tuple[str, Callable[[str], Any]]]] = {
+    "TransportState": ("transport_state", str.upper),
+    "CurrentCrossfadeMode": ("crossfade", _to_bool),
+    "CurrentTrack": ("track_number", _to_int),
+    "CurrentTrackDuration": ("track_duration", parse_duration),
+    "CurrentTrackURI": ("track_uri", str),
+    "Volume": ("volume", _to_int),
+    "Mute": ("mute", _to_bool),
+    "Bass": ("bass", _to_int),
+    "Treble": ("treble", _to_int),
+    "Loudness": ("loudness", _to_bool),
+    "NightMode": ("night_mode", _to_bool),
+    "DialogLevel": ("speech_enhancement", _to_bool),
+}
+
+
+def parse_last_change(last_change: str) -> dict[str, Any]:
+    """Parse a LastChange event document into speaker data updates."""
+    changes: dict[str, Any] = {}
+
+    if not last_change:
+        return changes
+
+    try:
+        root = ElementTree.fromstring(last_change)
+    except ElementTree.ParseError as err:
+        _LOGGER.debug("Could not parse LastChange event: %s", err)
+        return changes
+
+    for element in root.iter():
+        value = element.get("val")
+        if value is None:
+            continue
+
+        # Only the master channel maps onto the speaker's volume state
+        channel = element.get("channel")
+        if channel is not None and channel != "Master":
+            continue
+
+        tag = element.tag.rpartition("}")[2]
+
+        if tag == "CurrentPlayMode":
+            changes.update(parse_play_mode(value))
+        elif tag == "CurrentTrackMetaData":
+            metadata = parse_didl_metadata(value)
+            changes["track_title"] = metadata.get("title")
+            changes["track_artist"] = metadata.get("artist")
+            changes["track_album"] = metadata.get("album")
+            changes["album_art_uri"] = metadata.get("album_art")
+        elif field := LAST_CHANGE_FIELDS.get(tag):
+            key, convert = field
+            converted = convert(value)
+            if converted is not None:
+                changes[key] = converted
+
+    return changes
+
+
+def _get_source_ip(target_ip: str) -> str:
+    """Return the local address used to reach a speaker.
+
+    Connecting a UDP socket only selects a route; no packet is sent.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.connect((target_ip, SONOS_PORT))
+        return sock.getsockname()[0]
+
+
+class SonosEventListener:
+    """Subscribe to speaker events and receive their NOTIFY callbacks."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        on_event: Callable[[str, dict[str, Any]], None],
+        port: int,
+    ) -> None:
+        """Initialize the listener."""
+        self.hass = hass
+        self._session = session
+        self._on_event = on_event
+        self._listen_port = port
+        self._runner: web.AppRunner | None = None
+        self._port: int | None = None
+        # ip -> {event path: SID}
+        self._speaker_sids: dict[str, dict[str, str]] = {}
+        # SID -> (ip, event path)
+        self._sid_index: dict[str, tuple[str, str]] = {}
+        self._renewals: dict[str, CALLBACK_TYPE] = {}
+        self._pending: set[str] = set()
+        # SIDs that have delivered at least one NOTIFY
+        self._confirmed: set[str] = set()
+        self._notify_checks: dict[str, CALLBACK_TYPE] = {}
+        # ip -> monotonic time before which no subscription is attempted
+        self._unreachable: dict[str, float] = {}
+
+    @property
+    def listen_port(self) -> int:
+        """Return the configured port for event callbacks."""
+        return self._listen_port
+
+    @property
+    def running(self) -> bool:
+        """Return True if the callback server is accepting events."""
+        return self._port is not None
+
+    def is_subscribed(self, ip: str) -> bool:
+        """Return True if every event service of the speaker is subscribed."""
+        return len(self._speaker_sids.get(ip, ())) == len(EVENT_PATHS)
+
+    def is_live(self, ip: str) -> bool:
+        """Return True if every subscription of the speaker has delivered events."""
+        sids = self._speaker_sids.get(ip, {})
+        return len(sids) == len(EVENT_PATHS) and all(
+            sid in self._confirmed for sid in sids.values()
+        )
+
+    async def async_start(self) -> None:
+        """Start the HTTP server that receives NOTIFY callbacks."""
+        app = web.Application()
+        app.router.add_route("NOTIFY", NOTIFY_PATH, self._handle_notify)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+
+        try:
+            site = web.TCPSite(runner, "0.0.0.0", self._listen_port)
+            await site.start()
+        except OSError as err:
+            _LOGGER.warning(
+                "Could not listen for speaker events on port %s, falling back to polling: %s",
+                self._listen_port,
+                err,
+            )
+            await runner.cleanup()
+            return
+
+        self._runner = runner
+        self._port = runner.addresses[0][1]
+        _LOGGER.debug("Listening for speaker events on port %s", self._port)
+
+    async def async_stop(self) -> None:
+        """Cancel all subscriptions and stop the callback server."""
+        for cancel in (*self._renewals.values(), *self._notify_checks.values()):
+            cancel()
+        self._renewals.clear()
+        self._notify_checks.clear()
+
+        await asyncio.gather(
+            *(self._async_unsubscribe(sid) for sid in list(self._sid_index)),
+            return_exceptions=True,
+        )
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        self._port = None
+
+    @callback
+    def async_ensure_subscribed(self, ip: str) -> None:
+        """Subscribe to a speaker's events in the background if needed."""
+        if not self.running or ip in self._pending or self.is_subscribed(ip):
+            return
+        if self._unreachable.get(ip, 0) > time.monotonic():
+            return
+
+        self._pending.add(ip)
+        self.hass.async_create_background_task(
+            self._async_subscribe_speaker(ip),
+            f"sonos_subnet subscribe {ip}",
+        )
+
+    async def _async_subscribe_speaker(self, ip: str) -> None:
+        """Subscribe to all event services of a speaker."""
+        try:
+            callback_url = f"<http://{_get_source_ip(ip)}:{self._port}{NOTIFY_PATH}>"
+            await asyncio.gather(
+                *(
+                    self._async_subscribe(ip, path, callback_url)
+                    for path in EVENT_PATHS
+                    if path not in self._speaker_sids.get(ip, {})
+                )
+            )
+        except OSError as err:
+            _LOGGER.debug("Could not subscribe to events from %s: %s", ip, err)
+        finally:
+            self._pending.discard(ip)
+
+    async def _async_subscribe(self, ip: str, path: str, callback_url: str) -> None:
+        """Create a new subscription to one event service."""
+        headers = {
+            "CALLBACK": callback_url,
+            "NT": "upnp:event",
+            "TIMEOUT": f"Second-{SUBSCRIPTION_TIMEOUT}",
+        }
+        if (result := await self._async_send("SUBSCRIBE", ip, path, headers)) is None:
+            return
+
+        sid, timeout = result
+        self._speaker_sids.setdefault(ip, {})[path] = sid
+        self._sid_index[sid] = (ip, path)
+        self._schedule_renewal(sid, timeout)
+        self._notify_checks[sid] = async_call_later(
+            self.hass, FIRST_NOTIFY_TIMEOUT, partial(self._async_check_notified, sid)
+        )
+        _LOGGER.debug("Subscribed to %s on %s (SID %s)", path, ip, sid)
+
+    async def _async_check_notified(self, sid: str, _now: Any = None) -> None:
+        """Fall back to polling a speaker whose events never arrive."""
+        self._notify_checks.pop(sid, None)
+        if sid in self._confirmed or (target := self._sid_index.get(sid)) is None:
+            return
+
+        ip = target[0]
+        _LOGGER.warning(
+            "No events received from %s; check that it can reach Home Assistant "
+            "on port %s. Polling it instead",
+            ip,
+            self._port,
+        )
+        self._unreachable[ip] = time.monotonic() + UNREACHABLE_RETRY
+        for other_sid in list(self._speaker_sids.get(ip, {}).values()):
+            await self._async_unsubscribe(other_sid)
+
+    async def _async_renew(self, sid: str, _now: Any = None) -> None:
+        """Renew a subscription, resubscribing if the speaker forgot it."""
+        self._renewals.pop(sid, None)
+        if (target := self._sid_index.get(sid)) is None:
+            return
+
+        ip, path = target
+        headers = {"SID": sid, "TIMEOUT": f"Second-{SUBSCRIPTION_TIMEOUT}"}
+        if (result := await self._async_send("SUBSCRIBE", ip, path, headers)) is not None:
+            self._schedule_renewal(sid, result[1])
+            return
+
+        # Renewal failed; forget the SID so the next successful poll resubscribes
+        _LOGGER.debug("Could not renew %s on %s", path, ip)
+        self._forget(sid)
+
+    async def _async_unsubscribe(self, sid: str) -> None:
+        """Cancel a subscription on the speaker."""
+        if (target := self._forget(sid)) is None:
+            return
+
+        ip, path = target
+        await self._async_send("UNSUBSCRIBE", ip, path, {"SID": sid})
+
+    async def _async_send(
+        self,
+        method: str,
+        ip: str,
+        path: str,
+        headers: dict[str, str],
+    ) -> tuple[str, int] | None:
+        """Send a GENA request and return the (SID, timeout) it grants."""
+        url = f"http://{ip}:{SONOS_PORT}{path}"
+        try:
+            async with self._session.request(
+                method,
+                url,
+                headers=headers,
+                timeout=client_timeout(SUBSCRIBE_REQUEST_TIMEOUT),
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.debug("%s %s failed: HTTP %s", method, url, response.status)
+                    return None
+                sid = response.headers.get("SID", headers.get("SID", ""))
+                timeout = response.headers.get("TIMEOUT", "").rpartition("-")[2]
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as err:
+            _LOGGER.debug("%s %s failed: %s", method, url, err)
+            return None
+
+        try:
+            return sid, int(timeout)
+        except ValueError:
+            return sid, SUBSCRIPTION_TIMEOUT
+
+    @callback
+    def _schedule_renewal(self, sid: str, timeout: int) -> None:
+        """Renew a subscription shortly before it expires."""
+        self._renewals[sid] = async_call_later(
+            self.hass,
+            max(timeout - RENEW_MARGIN, RENEW_MARGIN),
+            partial(self._async_renew, sid),
+        )
+
+    @callback
+    def _forget(self, sid: str) -> tuple[str, str] | None:
+        """Drop local state for a subscription."""
+        if cancel := self._renewals.pop(sid, None):
+            cancel()
+        if cancel := self._notify_checks.pop(sid, None):
+            cancel()
+        self._confirmed.discard(sid)
+        if (target := self._sid_index.pop(sid, None)) is None:
+            return None
+
+        ip, path = target
+        sids = self._speaker_sids.get(ip, {})
+        sids.pop(path, None)
+        if not sids:
+            self._speaker_sids.pop(ip, None)
+        return target
+
+    async def _handle_notify(self, request: web.Request) -> web.Response:
+        """Handle a NOTIFY callback from a speaker."""
+        sid = request.headers.get("SID", "")
+        if (target := self._sid_index.get(sid)) is None:
+            return web.Response(status=412)
+
+        if sid not in self._confirmed:
+            self._confirmed.add(sid)
+            self._unreachable.pop(target[0], None)
+            if cancel := self._notify_checks.pop(sid, None):
+                cancel()
+
+        body = await request.read()
+        changes = parse_last_change(parse_xml_values(body, ("LastChange",)).get("LastChange", ""))
+        if changes:
+            self._on_event(target[0], changes)
+        return web.Response()
@@ -4,20 +4,96 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections.abc import Collection
+from functools import lru_cache
+from html import unescape
 from typing import Any
+from xml.etree import ElementTree
 from xml.sax.saxutils import escape
 
 import aiohttp
 
-from .const import SONOS_PORT
+from .const import SONOS_PORT, CONNECT_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
-# SOAP envelope for UPnP commands
-SOAP_ENVELOPE = '''<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
-<s:Body><u:{action} xmlns:u="urn:schemas-upnp-org:service:{service}:1">{arguments}</u:{action}></s:Body>
-</s:Envelope>'''
+# SOAP envelope for UPnP commands, split around the action arguments
+SOAP_ENVELOPE_PREFIX = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" '
+    's:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">\n'
+    '<s:Body><u:{action} xmlns:u="urn:schemas-upnp-org:service:{service}:1">'
+)
+SOAP_ENVELOPE_SUFFIX = "</u:{action}></s:Body>\n</s:Envelope>"
+
+# Identical requests currently on the wire, keyed by (ip, control URL, action, arguments)
+_INFLIGHT: dict[tuple[str, str, str, str], asyncio.Task[tuple[bool, str]]] = {}
+
+# Characters handed to the XML parser at a time
+XML_FEED_CHUNK = 2048
+
+# SOAP values that mean "true"
+TRUTHY_VALUES = frozenset(("1", "true", "on", "yes"))
+
+# Play modes that repeat the whole queue
+REPEAT_ALL_PLAY_MODES = frozenset(("REPEAT_ALL", "SHUFFLE", "SHUFFLE_REPEAT_ALL"))
+
+# DIDL-Lite element local names -> metadata keys
+DIDL_FIELDS = {
+    "title": "title",
+    "creator": "artist",
+    "album": "album",
+    "albumArtURI": "album_art",
+    "streamContent": "stream_content",
+    "radioShowMd": "radio_show",
+    "icon": "icon",
+}
+
+
+@lru_cache(maxsize=16)
+def client_timeout(timeout: float) -> aiohttp.ClientTimeout:
+    """Return per-phase timeouts for a request to a speaker.
+
+    Budgets apply to connecting and to each socket read rather than to
+    the whole request, so time spent queued behind other requests does
+    not count against it.
+    """
+    return aiohttp.ClientTimeout(
+        total=None,
+        sock_connect=min(CONNECT_TIMEOUT, timeout),
+        sock_read=timeout,
+    )
+
+
+@lru_cache(maxsize=64)
+def _soap_fragments(
+    service: str,
+    action: str,
+) -> tuple[bytes, bytes, dict[str, str]]:
+    """Return the encoded envelope prefix, suffix and headers for an action."""
+    prefix = SOAP_ENVELOPE_PREFIX.format(action=action, service=service)
+    suffix = SOAP_ENVELOPE_SUFFIX.format(action=action)
+    headers = {
+        "Content-Type": 'text/xml; charset="utf-8"',
+        "SOAPACTION": f'"urn:schemas-upnp-org:service:{service}:1#{action}"',
+    }
+    return prefix.encode("utf-8"), suffix.encode("utf-8"), headers
+
+
+@lru_cache(maxsize=256)
+def build_soap_request(
+    service: str,
+    action: str,
+    arguments: str,
+) -> tuple[bytes, dict[str, str]]:
+    """Build the encoded SOAP body and headers for a UPnP action.
+
+    Poll requests repeat the same few bodies, so results are cached.
+    Commands with fresh arguments only encode the arguments themselves.
+    The returned headers dict is shared and must not be mutated.
+    """
+    prefix, suffix, headers = _soap_fragments(service, action)
+    return b"".join((prefix, arguments.encode("utf-8"), suffix)), headers
 
 
 async def send_upnp_command(
@@ -27,45 +103,49 @@ async def send_upnp_command(
     arguments: str,
     control_url: str,
     timeout: int = 10,
+    session: aiohttp.ClientSession | None = None,
 ) -> tuple[bool, str]:
     """Send a UPnP SOAP command to a Sonos speaker.
     
+    If a session is given, its pooled keep-alive connections are reused;
+    otherwise a one-off session is opened for this request. A command
+    identical to one already in flight shares that request's result
+    instead of being sent again.
+    
     Returns (success, response_text).
     """
-    url = f"http://{ip}:{SONOS_PORT}{control_url}"
-    
-    soap_body = SOAP_ENVELOPE.format(
-        action=action,
-        service=service,
-        arguments=arguments,
-    )
+    key = (ip, control_url, action, arguments)
+    if (task := _INFLIGHT.get(key)) is None:
+        task = asyncio.create_task(
+            _send_upnp_command(ip, service, action, arguments, control_url, timeout, session)
+        )
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
     
-    headers = {
-        "Content-Type": 'text/xml; charset="utf-8"',
-        "SOAPACTION": f'"urn:schemas-upnp-org:service:{service}:1#{action}"',
-    }
+    # Shielded so one caller giving up does not cancel the others' request
+    return await asyncio.shield(task)
+
+
+async def _send_upnp_command(
+    ip: str,
+    service: str,
+    action: str,
+    arguments: str,
+    control_url: str,
+    timeout: int,
+    session: aiohttp.ClientSession | None,
+) -> tuple[bool, str]:
+    """Send a UPnP SOAP command and return (success, response_text)."""
+    url = f"http://{ip}:{SONOS_PORT}{control_url}"
+    soap_body, headers = build_soap_request(service, action, arguments)
     
     _LOGGER.debug("Sending UPnP command to %s: %s#%s", url, service, action)
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                data=soap_body.encode('utf-8'),
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as response:
-                response_text = await response.text()
-                
-                if response.status == 200:
-                    _LOGGER.debug("UPnP command %s succeeded for %s", action, ip)
-                    return True, response_text
-                else:
-                    _LOGGER.error(
-                        "UPnP command %s failed for %s: HTTP %s - %s",
-                        action, ip, response.status, response_text
-                    )
-                    return False, response_text
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await _post_soap(own_session, url, soap_body, headers, action, ip, timeout)
+        return await _post_soap(session, url, soap_body, headers, action, ip, timeout)
     except aiohttp.ClientError as err:
         _LOGGER.error("Connection error sending %s to %s: %s", action, ip, err)
         return False, str(err)
@@ -77,80 +157,164 @@ async def send_upnp_command(
         return False, str(err)
 
 
+async def _post_soap(
+    session: aiohttp.ClientSession,
+    url: str,
+    soap_body: bytes,
+    headers: dict[str, str],
+    action: str,
+    ip: str,
+    timeout: int,
+) -> tuple[bool, str]:
+    """POST a SOAP envelope using the given session."""
+    async with session.post(
+        url,
+        data=soap_body,
+        headers=headers,
+        timeout=client_timeout(timeout),
+    ) as response:
+        response_text = await response.text()
+        
+        if response.status == 200:
+            _LOGGER.debug("UPnP command %s succeeded for %s", action, ip)
+            return True, response_text
+        else:
+            _LOGGER.error(
+                "UPnP command %s failed for %s: HTTP %s - %s",
+                action, ip, response.status, response_text
+            )
+            return False, response_text
+
+
+@lru_cache(maxsize=64)
+def _tag_pattern(tag: str) -> re.Pattern[str]:
+    """Return a compiled pattern matching a tag that carries attributes."""
+    return re.compile(rf"<{tag}[^>]*>([^<]*)</{tag}>", re.DOTALL)
+
+
 def extract_xml_value(xml_text: str, tag: str) -> str | None:
     """Extract a value from XML text."""
-    patterns = [
-        rf"<{tag}>([^<]*)</{tag}>",
-        rf"<{tag}[^>]*>([^<]*)</{tag}>",
-    ]
+    # Fast path: plain <tag>value</tag> found with two substring searches
+    open_tag = f"<{tag}>"
+    start = xml_text.find(open_tag)
+    if start >= 0:
+        start += len(open_tag)
+        end = xml_text.find(f"</{tag}>", start)
+        if end >= 0 and "<" not in xml_text[start:end]:
+            return xml_text[start:end].strip()
     
-    for pattern in patterns:
-        match = re.search(pattern, xml_text, re.IGNORECASE | re.DOTALL)
-        if match:
-            return match.group(1).strip()
+    # Tag has attributes (or nested content); fall back to the regex
+    match = _tag_pattern(tag).search(xml_text)
+    if match:
+        return match.group(1).strip()
     
     return None
 
 
-def extract_xml_value_int(xml_text: str, tag: str, default: int = 0) -> int:
-    """Extract an integer value from XML text."""
-    value = extract_xml_value(xml_text, tag)
-    if value:
-        try:
-            return int(value)
-        except ValueError:
-            pass
-    return default
+def parse_xml_values(
+    xml_text: str | bytes,
+    tags: Collection[str] | None = None,
+) -> dict[str, str]:
+    """Parse an XML document into a {local tag name: text} map in one pass.
+
+    Namespace prefixes are dropped and the first occurrence of a tag wins.
+    Entity-escaped payloads (e.g. TrackMetaData) come back unescaped.
+    If tags are given, only those are collected and the body is fed in
+    chunks, so parsing stops at the chunk where the last of them is seen.
+    """
+    parser = ElementTree.XMLPullParser(events=("end",))
+    values: dict[str, str] = {}
+    try:
+        # Fed in chunks so the rest of a large body is skipped once done
+        for offset in range(0, len(xml_text), XML_FEED_CHUNK):
+            parser.feed(xml_text[offset : offset + XML_FEED_CHUNK])
+            for _, element in parser.read_events():
+                tag = element.tag.rpartition("}")[2]
+                if tag in values or (tags is not None and tag not in tags):
+                    continue
+                values[tag] = (element.text or "").strip()
+            if tags is not None and len(values) == len(tags):
+                break
+    except ElementTree.ParseError as err:
+        _LOGGER.debug("Could not parse SOAP response: %s", err)
+        return {}
+    return values
+
+
+def soap_value_int(values: dict[str, str], tag: str, default: int = 0) -> int:
+    """Return an integer value from a parsed SOAP response."""
+    try:
+        return int(values[tag])
+    except (KeyError, TypeError, ValueError):
+        return default
 
 
-def extract_xml_value_bool(xml_text: str, tag: str, default: bool = False) -> bool:
-    """Extract a boolean value from XML text."""
-    value = extract_xml_value(xml_text, tag)
+def soap_value_bool(values: dict[str, str], tag: str, default: bool = False) -> bool:
+    """Return a boolean value from a parsed SOAP response."""
+    value = values.get(tag)
     if value:
-        return value.lower() in ("1", "true", "on", "yes")
+        return value.lower() in TRUTHY_VALUES
     return default
 
 
+def parse_play_mode(play_mode: str) -> dict[str, bool]:
+    """Return the shuffle and repeat flags encoded in a Sonos play mode."""
+    repeat_one = play_mode.endswith("REPEAT_ONE")
+    return {
+        "shuffle": play_mode.startswith("SHUFFLE"),
+        # SHUFFLE on its own means shuffle with repeat all
+        "repeat": repeat_one or play_mode in REPEAT_ALL_PLAY_MODES,
+        "repeat_one": repeat_one,
+    }
+
+
 def parse_didl_metadata(didl: str) -> dict[str, Any]:
-    """Parse DIDL-Lite metadata from Sonos."""
+    """Parse DIDL-Lite metadata from Sonos in a single pass."""
     metadata = {}
     
     if not didl:
         return metadata
     
-    # Unescape HTML entities
-    didl = didl.replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"').replace("&amp;", "&")
+    # Metadata that is still entity-escaped needs unescaping first
+    if didl.lstrip().startswith("&lt;"):
+        didl = unescape(didl)
+    
+    try:
+        root = ElementTree.fromstring(didl)
+    except ElementTree.ParseError as err:
+        _LOGGER.debug("Could not parse DIDL metadata: %s", err)
+        return metadata
+    
+    found: dict[str, str] = {}
+    for element in root.iter():
+        tag = element.tag.rpartition("}")[2]
+        key = DIDL_FIELDS.get(tag)
+        if key is not None:
+            found.setdefault(key, (element.text or "").strip())
+        elif tag == "res" and "duration_str" not in metadata:
+            duration = element.get("duration")
+            if duration:
+                metadata["duration_str"] = duration
     
     # Extract basic track info
-    metadata["title"] = extract_xml_value(didl, "dc:title")
-    metadata["artist"] = extract_xml_value(didl, "dc:creator")
-    metadata["album"] = extract_xml_value(didl, "upnp:album")
-    metadata["album_art"] = extract_xml_value(didl, "upnp:albumArtURI")
-    
-    # Extract streaming radio specific metadata
-    metadata["stream_content"] = extract_xml_value(didl, "r:streamContent")
-    metadata["radio_show"] = extract_xml_value(didl, "r:radioShowMd")
-    
-    # If no album art, try alternative fields
-    if not metadata["album_art"]:
-        metadata["album_art"] = extract_xml_value(didl, "upnp:icon") or extract_xml_value(didl, "albumArtURI")
-    
-    # Extract duration
-    duration_str = extract_xml_value(didl, "res")
-    if duration_str:
-        duration_match = re.search(r'duration="([^"]+)"', didl)
-        if duration_match:
-            metadata["duration_str"] = duration_match.group(1)
+    metadata["title"] = found.get("title")
+    metadata["artist"] = found.get("artist")
+    metadata["album"] = found.get("album")
+    # If no album art, fall back to the icon
+    metadata["album_art"] = found.get("album_art") or found.get("icon")
+    
+    # Streaming radio specific metadata
+    metadata["stream_content"] = found.get("stream_content")
+    metadata["radio_show"] = found.get("radio_show")
     
     return metadata
 
 
 def format_duration(seconds: int) -> str:
-    """Format seconds as HH:MM:SS."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    return f"{hours}:{minutes:02d}:{secs:02d}"
+    """Format seconds as H:MM:SS."""
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    return "%d:%02d:%02d" % (hours, minutes, secs)
 
 
 def parse_duration(duration_str: str) -> int:
@@ -170,6 +334,10 @@ def parse_duration(duration_str: str) -> int:
     return 0
 
 
+@lru_cache(maxsize=256)
 def escape_xml(text: str) -> str:
-    """Escape special XML characters."""
+    """Escape special XML characters.
+
+    Cached since the same stream and announcement URIs are played repeatedly.
+    """
     return escape(text) if text else ""
@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
+import requests
 import soco
+from soco.exceptions import SoCoException
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -17,9 +21,9 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -28,12 +32,75 @@ from .const import (
     CONTROL_RENDERING,
     UPNP_AV_TRANSPORT,
     UPNP_RENDERING_CONTROL,
+    SIGNAL_SPEAKER_UPDATED,
 )
-from .coordinator import SonosSubnetCoordinator
-from .helpers import send_upnp_command, escape_xml
+from .coordinator import SonosSubnetCoordinator, SpeakerState
+from .helpers import send_upnp_command, escape_xml, format_duration, parse_play_mode
 
 _LOGGER = logging.getLogger(__name__)
 
+VOLUME_STEP = 0.05
+# Volume up/down presses within this window are sent as one command
+VOLUME_STEP_COOLDOWN = 0.1
+# Members joined to a group at the same time
+JOIN_CONCURRENCY = 4
+
+# Errors a SoCo command can fail with. Property writes are idempotent, so they
+# are retried once after a network error; UPnP faults (e.g. 701) never are
+SOCO_ERRORS = (SoCoException, requests.RequestException)
+TRANSIENT_SOCO_ERRORS = (requests.ConnectionError, requests.Timeout)
+SOCO_RETRY_DELAY = 0.25
+# Marks a property with no queued write
+_UNSET = object()
+
+# SOAP argument bodies, built once at import
+INSTANCE_ARGS = "<InstanceID>0</InstanceID>"
+PLAY_MODE_ARGS_TEMPLATE = "<InstanceID>0</InstanceID><NewPlayMode>%s</NewPlayMode>"
+SET_URI_ARGS_TEMPLATE = (
+    "<InstanceID>0</InstanceID><CurrentURI>%s</CurrentURI>"
+    "<CurrentURIMetaData>%s</CurrentURIMetaData>"
+)
+
+# DIDL-Lite metadata around a stream URI, split so the fixed parts are
+# XML-escaped for CurrentURIMetaData once at import
+DIDL_PREFIX = (
+    '<DIDL-Lite xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/" '
+    'xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/" '
+    'xmlns:r="urn:schemas-rinconnetworks-com:metadata-1-0/">\n'
+    '<item id="1" parentID="0" restricted="1">\n'
+    "<dc:title>Audio Stream</dc:title>\n"
+    "<upnp:class>object.item.audioItem.musicTrack</upnp:class>\n"
+    '<res protocolInfo="http-get:*:audio/mpeg:*">'
+)
+DIDL_SUFFIX = "</res>\n</item>\n</DIDL-Lite>"
+ESCAPED_DIDL_PREFIX = escape_xml(DIDL_PREFIX)
+ESCAPED_DIDL_SUFFIX = escape_xml(DIDL_SUFFIX)
+# Whole SetAVTransportURI body for a stream: (escaped URI, doubly escaped URI)
+PLAY_URI_ARGS_TEMPLATE = SET_URI_ARGS_TEMPLATE % (
+    "%s",
+    ESCAPED_DIDL_PREFIX + "%s" + ESCAPED_DIDL_SUFFIX,
+)
+
+# UPnP transport states -> media player states
+TRANSPORT_STATE_MAP: Final = MappingProxyType({
+    "PLAYING": MediaPlayerState.PLAYING,
+    "PAUSED_PLAYBACK": MediaPlayerState.PAUSED,
+    "PAUSED": MediaPlayerState.PAUSED,
+    "STOPPED": MediaPlayerState.IDLE,
+    "TRANSITIONING": MediaPlayerState.BUFFERING,
+})
+
+# (shuffle, repeat mode) -> Sonos play mode
+PLAY_MODES: Final = MappingProxyType({
+    (False, RepeatMode.OFF): "NORMAL",
+    (True, RepeatMode.OFF): "SHUFFLE_NOREPEAT",
+    (False, RepeatMode.ALL): "REPEAT_ALL",
+    (True, RepeatMode.ALL): "SHUFFLE_REPEAT_ALL",
+    (False, RepeatMode.ONE): "REPEAT_ONE",
+    (True, RepeatMode.ONE): "SHUFFLE_REPEAT_ONE",
+})
+
 SUPPORTED_FEATURES = (
     MediaPlayerEntityFeature.PAUSE
     | MediaPlayerEntityFeature.PLAY
@@ -60,36 +127,39 @@ async def async_setup_entry(
     """Set up Sonos media player from a config entry."""
     coordinator: SonosSubnetCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SonosSubnetMediaPlayer] = []
-
-    for ip, speaker_info in coordinator.speakers.items():
-        entities.append(SonosSubnetMediaPlayer(coordinator, ip, speaker_info))
-
-    async_add_entities(entities)
-
-    @callback
-    def async_add_new_speakers() -> None:
-        """Add any new speakers that appear in the coordinator."""
-        existing_ips = {entity.ip_address for entity in entities}
-        new_entities = []
-
-        for ip, speaker_info in coordinator.speakers.items():
-            if ip not in existing_ips:
-                new_entity = SonosSubnetMediaPlayer(coordinator, ip, speaker_info)
-                entities.append(new_entity)
-                new_entities.append(new_entity)
-
-        if new_entities:
-            async_add_entities(new_entities)
-
-    entry.async_on_unload(
-        coordinator.async_add_listener(async_add_new_speakers)
+    async_add_entities(
+        SonosSubnetMediaPlayer(coordinator, ip, speaker_info)
+        for ip, speaker_info in coordinator.speakers.items()
     )
 
 
-class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPlayerEntity):
-    """Representation of a Sonos speaker on a remote subnet."""
+class SonosSubnetMediaPlayer(MediaPlayerEntity):
+    """Representation of a Sonos speaker on a remote subnet.
+
+    Updates arrive on a per-speaker dispatcher signal rather than through
+    CoordinatorEntity, so a poll only wakes the players whose data changed.
+    A plain coordinator listener only tracks whether the last poll failed.
+    """
+
+    # Fields added by this class live in slots; base classes keep their __dict__
+    __slots__ = (
+        "_ip_address",
+        "_speaker_info",
+        "_device_id",
+        "_speaker_state",
+        "_last_update_success",
+        "_soco",
+        "_soco_lock",
+        "_soco_writes",
+        "_pending_volume",
+        "_volume_debouncer",
+        "_group_members_cache",
+        "_state_write_pending",
+        "_art_prefix",
+        "_art_cache",
+    )
 
+    _attr_should_poll = False
     _attr_has_entity_name = True
     _attr_name = None
     _attr_media_content_type = MediaType.MUSIC
@@ -101,17 +171,67 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
         speaker_info: dict[str, Any],
     ) -> None:
         """Initialize the media player."""
-        super().__init__(coordinator)
+        self.coordinator = coordinator
         
         self._ip_address = ip_address
         self._speaker_info = speaker_info
         # Base ID for device grouping (shared across all entity types)
-        self._device_id = speaker_info.get("uuid") or speaker_info.get("serial_number") or ip_address
+        self._device_id, self._attr_device_info = coordinator.get_device_meta(
+            ip_address, speaker_info
+        )
         # Prefix unique_id to avoid collision with built-in Sonos integration
         self._attr_unique_id = f"sonos_subnet_{self._device_id}"
         
+        # Snapshot of the fields the state properties read, replaced on change
+        self._speaker_state = SpeakerState.from_data(
+            (coordinator.data or {}).get(ip_address, {})
+        )
+        # Poll outcome last written to the state machine
+        self._last_update_success = coordinator.last_update_success
+        
         # Create SoCo instance for direct speaker control
         self._soco = soco.SoCo(ip_address)
+        # SoCo calls to one speaker run one at a time; queued property
+        # writes keep only their latest value
+        self._soco_lock = asyncio.Lock()
+        self._soco_writes: dict[str, Any] = {}
+        
+        # Volume steps waiting to be sent as one SetVolume
+        self._pending_volume: float | None = None
+        self._volume_debouncer: Debouncer | None = None
+        
+        # Optimistic changes made in the same loop tick share one state write
+        self._state_write_pending = False
+        
+        # Relative album art paths are served by the speaker itself
+        self._art_prefix = f"http://{ip_address}:{SONOS_PORT}"
+        # (album_art_uri, resolved URL) from the last read
+        self._art_cache: tuple[str | None, str | None] = (None, None)
+        
+        # (member IP list, entity index version, entity_ids) from the last lookup
+        self._group_members_cache: tuple[Any, int, list[str] | None] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for speaker updates and set up the volume step debouncer."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_SPEAKER_UPDATED.format(self._ip_address),
+                self._async_handle_speaker_update,
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._async_handle_coordinator_update)
+        )
+        self._volume_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=VOLUME_STEP_COOLDOWN,
+            immediate=False,
+            function=self._async_flush_volume_step,
+        )
+        self.async_on_remove(self._volume_debouncer.async_cancel)
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
@@ -123,30 +243,10 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
         """Return the IP address of this speaker."""
         return self._ip_address
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this speaker."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._speaker_info.get("zone_name", f"Sonos ({self._ip_address})"),
-            manufacturer="Sonos",
-            model=self._speaker_info.get("model_name", "Unknown"),
-            sw_version=self._speaker_info.get("software_version"),
-            hw_version=self._speaker_info.get("hardware_version"),
-            configuration_url=f"http://{self._ip_address}:{SONOS_PORT}/",
-        )
-
-    @property
-    def _speaker_data(self) -> dict[str, Any]:
-        """Return current speaker data from coordinator."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(self._ip_address, {})
-        return {}
-
     @property
     def available(self) -> bool:
         """Return if the speaker is available."""
-        return self._speaker_data.get("available", False)
+        return self.coordinator.last_update_success and bool(self._speaker_state.available)
 
     @property
     def state(self) -> MediaPlayerState:
@@ -154,22 +254,15 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
         if not self.available:
             return MediaPlayerState.OFF
         
-        transport_state = self._speaker_data.get("transport_state", "").upper()
-        
-        state_map = {
-            "PLAYING": MediaPlayerState.PLAYING,
-            "PAUSED_PLAYBACK": MediaPlayerState.PAUSED,
-            "PAUSED": MediaPlayerState.PAUSED,
-            "STOPPED": MediaPlayerState.IDLE,
-            "TRANSITIONING": MediaPlayerState.BUFFERING,
-        }
-        
-        return state_map.get(transport_state, MediaPlayerState.IDLE)
+        # The coordinator stores transport_state upper-cased
+        return TRANSPORT_STATE_MAP.get(
+            self._speaker_state.transport_state, MediaPlayerState.IDLE
+        )
 
     @property
     def volume_level(self) -> float | None:
         """Return the volume level (0..1)."""
-        volume = self._speaker_data.get("volume")
+        volume = self._speaker_state.volume
         if volume is not None:
             return volume / 100
         return None
@@ -177,30 +270,30 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
     @property
     def is_volume_muted(self) -> bool | None:
         """Return if volume is muted."""
-        return self._speaker_data.get("mute")
+        return self._speaker_state.mute
 
     @property
     def shuffle(self) -> bool | None:
         """Return if shuffle is enabled."""
-        return self._speaker_data.get("shuffle")
+        return self._speaker_state.shuffle
 
     @property
     def repeat(self) -> RepeatMode | None:
         """Return repeat mode."""
-        if self._speaker_data.get("repeat_one"):
+        if self._speaker_state.repeat_one:
             return RepeatMode.ONE
-        elif self._speaker_data.get("repeat"):
+        elif self._speaker_state.repeat:
             return RepeatMode.ALL
         return RepeatMode.OFF
 
     @property
     def media_title(self) -> str | None:
         """Return the title of current playing media."""
-        title = self._speaker_data.get("track_title")
+        title = self._speaker_state.track_title
         
         # Fallback: If no title, try to parse from URI for streaming radio
         if not title:
-            track_uri = self._speaker_data.get("track_uri", "")
+            track_uri = self._speaker_state.track_uri
             if track_uri:
                 # Don't show raw URIs, return None instead so HA can handle it
                 if track_uri.startswith(("http://", "https://", "x-rincon", "x-sonos")):
@@ -211,245 +304,252 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
     @property
     def media_artist(self) -> str | None:
         """Return the artist of current playing media."""
-        return self._speaker_data.get("track_artist")
+        return self._speaker_state.track_artist
 
     @property
     def media_album_name(self) -> str | None:
         """Return the album name of current playing media."""
-        return self._speaker_data.get("track_album")
+        return self._speaker_state.track_album
 
     @property
     def media_image_url(self) -> str | None:
         """Return the image URL of current playing media."""
-        album_art = self._speaker_data.get("album_art_uri")
-        if album_art:
-            if album_art.startswith("http"):
-                return album_art
-            return f"http://{self._ip_address}:{SONOS_PORT}{album_art}"
-        return None
+        album_art = self._speaker_state.album_art_uri
+        if album_art == self._art_cache[0]:
+            return self._art_cache[1]
+        
+        url = album_art
+        if album_art and not album_art.startswith("http"):
+            url = self._art_prefix + album_art
+        self._art_cache = (album_art, url or None)
+        return url or None
 
     @property
     def media_duration(self) -> int | None:
         """Return the duration of current playing media in seconds."""
-        return self._speaker_data.get("track_duration")
+        return self._speaker_state.track_duration
 
     @property
     def media_position(self) -> int | None:
         """Return the position of current playing media in seconds."""
-        return self._speaker_data.get("track_position")
+        return self._speaker_state.track_position
 
     @property
     def media_track(self) -> int | None:
         """Return the track number of current playing media."""
-        return self._speaker_data.get("track_number")
+        return self._speaker_state.track_number
 
     @property
     def group_members(self) -> list[str] | None:
         """Return list of entity_ids of group members."""
-        member_ips = self._speaker_data.get("group_members", [])
-        
-        _LOGGER.debug("Speaker %s group_members from data: %s", self._ip_address, member_ips)
+        member_ips = self._speaker_state.group_members
         
         if not member_ips or len(member_ips) <= 1:
             return None
         
-        # Convert IPs to entity_ids
-        entity_ids = []
-        for ip in member_ips:
-            if ip in self.coordinator.speakers:
-                info = self.coordinator.speakers[ip]
-                zone_name = info.get("zone_name", "")
-                if zone_name:
-                    entity_id = f"media_player.{zone_name.lower().replace(' ', '_')}"
-                    entity_ids.append(entity_id)
-                    _LOGGER.debug("Mapped IP %s to entity %s", ip, entity_id)
+        # Reuse the mapping until the member list or the entity index changes
+        version = self.coordinator.entity_index_version
+        cache = self._group_members_cache
+        if cache is not None and cache[0] is member_ips and cache[1] == version:
+            return cache[2]
         
-        _LOGGER.debug("Final group_members for %s: %s", self._ip_address, entity_ids)
-        return entity_ids if entity_ids else None
+        entity_ids = self.coordinator.get_entity_ids_from_ips(member_ips) or None
+        _LOGGER.debug("Group members for %s: %s", self._ip_address, entity_ids)
+        self._group_members_cache = (member_ips, version, entity_ids)
+        return entity_ids
 
     # Transport Controls (via SoCo)
     async def async_media_play(self) -> None:
         """Send play command."""
-        _LOGGER.info("Sending PLAY command to %s", self._ip_address)
+        _LOGGER.debug("Sending PLAY command to %s", self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._soco.play)
-        except Exception as exc:
+            await self._async_soco_call(self._soco.play)
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo play failed for %s: %s", self._ip_address, exc)
             return
-        await self.coordinator.async_request_refresh()
+        self._async_apply_optimistic(transport_state="PLAYING")
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
-        _LOGGER.info("Sending PAUSE command to %s", self._ip_address)
+        _LOGGER.debug("Sending PAUSE command to %s", self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._soco.pause)
-        except Exception as exc:
+            await self._async_soco_call(self._soco.pause)
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo pause failed for %s: %s", self._ip_address, exc)
             return
-        await self.coordinator.async_request_refresh()
+        self._async_apply_optimistic(transport_state="PAUSED_PLAYBACK")
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        _LOGGER.info("Sending STOP command to %s", self._ip_address)
+        _LOGGER.debug("Sending STOP command to %s", self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._soco.stop)
-        except Exception as exc:
+            await self._async_soco_call(self._soco.stop)
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo stop failed for %s: %s", self._ip_address, exc)
             return
-        await self.coordinator.async_request_refresh()
+        self._async_apply_optimistic(transport_state="STOPPED")
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
-        _LOGGER.info("Sending NEXT command to %s", self._ip_address)
+        _LOGGER.debug("Sending NEXT command to %s", self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._soco.next)
-        except Exception as exc:
+            await self._async_soco_call(self._soco.next)
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo next failed for %s: %s", self._ip_address, exc)
             return
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_after_command(self._ip_address)
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
-        _LOGGER.info("Sending PREVIOUS command to %s", self._ip_address)
+        _LOGGER.debug("Sending PREVIOUS command to %s", self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._soco.previous)
-        except Exception as exc:
+            await self._async_soco_call(self._soco.previous)
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo previous failed for %s: %s", self._ip_address, exc)
             return
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_after_command(self._ip_address)
 
     async def async_media_seek(self, position: float) -> None:
         """Seek to a position."""
-        hours = int(position // 3600)
-        minutes = int((position % 3600) // 60)
-        seconds = int(position % 60)
-        target = f"{hours}:{minutes:02d}:{seconds:02d}"
+        target = format_duration(position)
         
-        _LOGGER.info("Seeking to %s on %s", target, self._ip_address)
+        _LOGGER.debug("Seeking to %s on %s", target, self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._soco.seek, target)
-        except Exception as exc:
+            await self._async_soco_call(self._soco.seek, target)
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo seek failed for %s: %s", self._ip_address, exc)
             return
-        await self.coordinator.async_request_refresh()
+        self._async_apply_optimistic(track_position=int(position))
 
     async def async_clear_playlist(self) -> None:
         """Clear the queue."""
-        _LOGGER.info("Clearing queue on %s", self._ip_address)
+        _LOGGER.debug("Clearing queue on %s", self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._soco.clear_queue)
-        except Exception as exc:
+            await self._async_soco_call(self._soco.clear_queue)
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo clear queue failed for %s: %s", self._ip_address, exc)
             return
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_after_command(self._ip_address)
 
     # Volume Controls (via SoCo)
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level (0..1)."""
         volume_percent = int(volume * 100)
-        _LOGGER.warning(
-            "Setting volume to %d%% on %s (entity=%s, features=%s)",
-            volume_percent,
-            self._ip_address,
-            self.entity_id,
-            self.supported_features,
-        )
-        try:
-            await self.hass.async_add_executor_job(
-                self._set_soco_volume, volume_percent
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Setting volume to %d%% on %s (entity=%s, features=%s)",
+                volume_percent,
+                self._ip_address,
+                self.entity_id,
+                self.supported_features,
             )
-        except Exception as exc:
+        await self._async_send_volume(volume_percent)
+
+    async def _async_send_volume(self, volume_percent: int) -> None:
+        """Send a volume level and show it right away."""
+        try:
+            if not await self._async_soco_set("volume", volume_percent):
+                return
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo set volume failed for %s: %s", self._ip_address, exc)
             return
         # Optimistically update local state so the UI slider doesn't snap back
-        if self.coordinator.data and self._ip_address in self.coordinator.data:
-            self.coordinator.data[self._ip_address]["volume"] = volume_percent
-        self.async_write_ha_state()
-
-    def _set_soco_volume(self, volume: int) -> None:
-        """Set volume via SoCo (runs in executor)."""
-        self._soco.volume = volume
+        self._async_apply_optimistic(volume=volume_percent)
 
     async def async_volume_up(self) -> None:
         """Turn volume up."""
-        current = self.volume_level or 0
-        await self.async_set_volume_level(min(1.0, current + 0.05))
+        await self._async_step_volume(VOLUME_STEP)
 
     async def async_volume_down(self) -> None:
         """Turn volume down."""
-        current = self.volume_level or 0
-        await self.async_set_volume_level(max(0.0, current - 0.05))
+        await self._async_step_volume(-VOLUME_STEP)
+
+    async def _async_step_volume(self, step: float) -> None:
+        """Queue a volume step; rapid presses are sent as one final level."""
+        current = self._pending_volume
+        if current is None:
+            current = self.volume_level or 0
+        self._pending_volume = min(1.0, max(0.0, current + step))
+        await self._volume_debouncer.async_call()
+
+    async def _async_flush_volume_step(self) -> None:
+        """Send the volume level accumulated by queued steps."""
+        if (volume := self._pending_volume) is None:
+            return
+        # Straight to SoCo; the per-call logging of set_volume_level is skipped
+        await self._async_send_volume(round(volume * 100))
+        # Keep stepping from the queued level if more presses arrived meanwhile
+        if self._pending_volume == volume:
+            self._pending_volume = None
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
-        _LOGGER.info("Setting mute to %s on %s", mute, self._ip_address)
+        _LOGGER.debug("Setting mute to %s on %s", mute, self._ip_address)
         try:
-            await self.hass.async_add_executor_job(self._set_soco_mute, mute)
-        except Exception as exc:
+            if not await self._async_soco_set("mute", mute):
+                return
+        except SOCO_ERRORS as exc:
             _LOGGER.error("SoCo set mute failed for %s: %s", self._ip_address, exc)
             return
-        # Optimistically update local state
-        if self.coordinator.data and self._ip_address in self.coordinator.data:
-            self.coordinator.data[self._ip_address]["mute"] = mute
-        self.async_write_ha_state()
-
-    def _set_soco_mute(self, mute: bool) -> None:
-        """Set mute via SoCo (runs in executor)."""
-        self._soco.mute = mute
+        self._async_apply_optimistic(mute=mute)
 
     # Shuffle/Repeat (via SoCo)
     async def async_set_shuffle(self, shuffle: bool) -> None:
         """Set shuffle mode."""
-        current_repeat = self._speaker_data.get("repeat", False)
-        current_repeat_one = self._speaker_data.get("repeat_one", False)
-        
-        if current_repeat_one:
-            play_mode = "SHUFFLE_REPEAT_ONE" if shuffle else "REPEAT_ONE"
-        elif current_repeat:
-            play_mode = "SHUFFLE_REPEAT_ALL" if shuffle else "REPEAT_ALL"
-        else:
-            play_mode = "SHUFFLE_NOREPEAT" if shuffle else "NORMAL"
-        
-        _LOGGER.info("Setting play mode to %s on %s", play_mode, self._ip_address)
-        try:
-            await self.hass.async_add_executor_job(
-                self._set_soco_play_mode, play_mode
-            )
-        except Exception:
-            # Fallback to UPnP
-            await self._send_av_transport_command(
-                "SetPlayMode",
-                f"<InstanceID>0</InstanceID><NewPlayMode>{play_mode}</NewPlayMode>"
-            )
-        await self.coordinator.async_request_refresh()
+        await self._async_set_play_mode(PLAY_MODES[shuffle, self.repeat])
 
     async def async_set_repeat(self, repeat: RepeatMode) -> None:
         """Set repeat mode."""
-        current_shuffle = self._speaker_data.get("shuffle", False)
-        
-        if repeat == RepeatMode.ONE:
-            play_mode = "SHUFFLE_REPEAT_ONE" if current_shuffle else "REPEAT_ONE"
-        elif repeat == RepeatMode.ALL:
-            play_mode = "SHUFFLE_REPEAT_ALL" if current_shuffle else "REPEAT_ALL"
-        else:
-            play_mode = "SHUFFLE_NOREPEAT" if current_shuffle else "NORMAL"
-        
-        _LOGGER.info("Setting play mode to %s on %s", play_mode, self._ip_address)
+        await self._async_set_play_mode(
+            PLAY_MODES[bool(self._speaker_state.shuffle), repeat]
+        )
+
+    async def _async_set_play_mode(self, play_mode: str) -> None:
+        """Set the speaker's play mode, falling back to UPnP if SoCo fails."""
+        _LOGGER.debug("Setting play mode to %s on %s", play_mode, self._ip_address)
         try:
-            await self.hass.async_add_executor_job(
-                self._set_soco_play_mode, play_mode
-            )
-        except Exception:
+            if not await self._async_soco_set("play_mode", play_mode):
+                return
+        except SOCO_ERRORS:
             # Fallback to UPnP
-            await self._send_av_transport_command(
+            if not await self._send_av_transport_command(
                 "SetPlayMode",
-                f"<InstanceID>0</InstanceID><NewPlayMode>{play_mode}</NewPlayMode>"
-            )
-        await self.coordinator.async_request_refresh()
-
-    def _set_soco_play_mode(self, mode: str) -> None:
-        """Set play mode via SoCo (runs in executor)."""
-        self._soco.play_mode = mode
+                PLAY_MODE_ARGS_TEMPLATE % play_mode,
+            ):
+                return
+        self._async_apply_optimistic(**parse_play_mode(play_mode))
+
+    # SoCo Command Helpers
+    async def _async_soco_call(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Run a SoCo method in the executor, one call per speaker at a time."""
+        async with self._soco_lock:
+            # Not retried: next/previous/seek may have landed before a timeout
+            return await self.hass.async_add_executor_job(method, *args)
+
+    async def _async_soco_set(self, attribute: str, value: Any) -> bool:
+        """Set a SoCo property, coalescing writes queued behind a running call.
+
+        Only the latest value of each property is sent once the speaker is free.
+        Returns True if this call's value was sent, False if a later call
+        superseded it; a failed write raises, so callers only show state that
+        they sent themselves.
+        """
+        self._soco_writes[attribute] = value
+        async with self._soco_lock:
+            if self._soco_writes.get(attribute, _UNSET) is not value:
+                return False
+            del self._soco_writes[attribute]
+            await self._async_soco_executor(setattr, self._soco, attribute, value)
+            return True
+
+    async def _async_soco_executor(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run an idempotent blocking SoCo call, retrying once after a network error."""
+        try:
+            return await self.hass.async_add_executor_job(func, *args)
+        except TRANSIENT_SOCO_ERRORS as err:
+            _LOGGER.debug("Retrying SoCo call on %s after: %s", self._ip_address, err)
+        await asyncio.sleep(SOCO_RETRY_DELAY)
+        return await self.hass.async_add_executor_job(func, *args)
 
     # Play Media
     async def async_play_media(
@@ -461,28 +561,39 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
         **kwargs: Any,
     ) -> None:
         """Play media from a URL or media ID."""
-        _LOGGER.info("Playing media %s on %s", media_id, self._ip_address)
-        
-        # Create DIDL-Lite metadata
-        didl = f'''<DIDL-Lite xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/" xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/" xmlns:r="urn:schemas-rinconnetworks-com:metadata-1-0/">
-<item id="1" parentID="0" restricted="1">
-<dc:title>Audio Stream</dc:title>
-<upnp:class>object.item.audioItem.musicTrack</upnp:class>
-<res protocolInfo="http-get:*:audio/mpeg:*">{escape_xml(media_id)}</res>
-</item>
-</DIDL-Lite>'''
+        _LOGGER.debug("Playing media %s on %s", media_id, self._ip_address)
         
+        # The URI inside the DIDL-Lite metadata is escaped a second time
+        # because the metadata itself is embedded as escaped text
         escaped_uri = escape_xml(media_id)
-        escaped_didl = escape_xml(didl)
         
         # Set the URI
-        await self._send_av_transport_command(
+        if not await self._send_av_transport_command(
             "SetAVTransportURI",
-            f"<InstanceID>0</InstanceID><CurrentURI>{escaped_uri}</CurrentURI><CurrentURIMetaData>{escaped_didl}</CurrentURIMetaData>"
-        )
+            PLAY_URI_ARGS_TEMPLATE % (escaped_uri, escape_xml(escaped_uri)),
+        ):
+            return
         
-        # Start playback
+        # Start playback, then pick up the new track's metadata
         await self.async_media_play()
+        await self.coordinator.async_refresh_after_command(self._ip_address)
+
+    @callback
+    def _async_apply_optimistic(self, **changes: Any) -> None:
+        """Show the state a successful command implies without polling for it."""
+        if self.coordinator.data and self._ip_address in self.coordinator.data:
+            self.coordinator.data[self._ip_address].update(changes)
+        self._speaker_state = self._speaker_state._replace(**changes)
+        if not self._state_write_pending:
+            self._state_write_pending = True
+            self.hass.loop.call_soon(self._async_flush_state_write)
+
+    @callback
+    def _async_flush_state_write(self) -> None:
+        """Write the optimistic changes accumulated during this loop tick."""
+        self._state_write_pending = False
+        if self.hass is not None and self.entity_id:
+            self.async_write_ha_state()
 
     # UPnP Command Helpers
     async def _send_av_transport_command(self, action: str, arguments: str) -> bool:
@@ -493,9 +604,8 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
             action,
             arguments,
             CONTROL_AV_TRANSPORT,
+            session=self.coordinator.session,
         )
-        if success:
-            await self.coordinator.async_request_refresh()
         return success
 
     async def _send_rendering_command(self, action: str, arguments: str) -> bool:
@@ -506,16 +616,15 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
             action,
             arguments,
             CONTROL_RENDERING,
+            session=self.coordinator.session,
         )
-        if success:
-            await self.coordinator.async_request_refresh()
         return success
 
     # Grouping Methods
     async def async_join_players(self, group_members: list[str]) -> None:
         """Join other players to this player (this player becomes coordinator)."""
-        _LOGGER.warning("async_join_players CALLED! Master: %s, Members to join: %s", self.entity_id, group_members)
-        _LOGGER.warning("Master UUID: %s, Master IP: %s", self._speaker_info.get("uuid"), self._ip_address)
+        _LOGGER.debug("Joining players to %s: %s", self.entity_id, group_members)
+        _LOGGER.debug("Master UUID: %s, Master IP: %s", self._speaker_info.get("uuid"), self._ip_address)
         
         # Get this speaker's UUID (master/coordinator)
         master_uuid = self._speaker_info.get("uuid", "")
@@ -524,9 +633,12 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
             return
         
         coordinator_uri = f"x-rincon:{master_uuid}"
-        _LOGGER.warning("Coordinator URI: %s", coordinator_uri)
+        _LOGGER.debug("Coordinator URI: %s", coordinator_uri)
+        # Every member gets the same SetAVTransportURI body
+        join_args = SET_URI_ARGS_TEMPLATE % (coordinator_uri, "")
         
-        # Join each member to this coordinator
+        # Resolve the members to join to this coordinator
+        members: list[tuple[str, str]] = []
         for member_entity_id in group_members:
             # Skip if trying to join to itself
             if member_entity_id == self.entity_id:
@@ -539,42 +651,65 @@ class SonosSubnetMediaPlayer(CoordinatorEntity[SonosSubnetCoordinator], MediaPla
                 _LOGGER.error("Could not find IP for entity %s", member_entity_id)
                 continue
             
-            _LOGGER.warning("Joining %s (%s) to coordinator %s (%s)", member_entity_id, member_ip, self.entity_id, self._ip_address)
-            
-            success, _ = await send_upnp_command(
-                member_ip,
-                UPNP_AV_TRANSPORT,
-                "SetAVTransportURI",
-                f"<InstanceID>0</InstanceID><CurrentURI>{coordinator_uri}</CurrentURI><CurrentURIMetaData></CurrentURIMetaData>",
-                CONTROL_AV_TRANSPORT,
-            )
-            
+            _LOGGER.debug("Joining %s (%s) to coordinator %s (%s)", member_entity_id, member_ip, self.entity_id, self._ip_address)
+            members.append((member_entity_id, member_ip))
+        
+        # Only the coordinator needs to exist first; members can join in parallel
+        semaphore = asyncio.Semaphore(JOIN_CONCURRENCY)
+        
+        async def _join(member_ip: str) -> tuple[bool, str]:
+            async with semaphore:
+                return await send_upnp_command(
+                    member_ip,
+                    UPNP_AV_TRANSPORT,
+                    "SetAVTransportURI",
+                    join_args,
+                    CONTROL_AV_TRANSPORT,
+                    session=self.coordinator.session,
+                )
+        
+        results = await asyncio.gather(*(_join(member_ip) for _, member_ip in members))
+        for (member_entity_id, _), (success, _) in zip(members, results):
             if not success:
                 _LOGGER.error("Failed to join %s to group", member_entity_id)
         
-        # Request refresh after grouping
-        await self.coordinator.async_request_refresh()
+        # Refresh once after grouping, together with any other grouping calls
+        await self.coordinator.group_refresh.async_call()
 
     async def async_unjoin_player(self) -> None:
         """Unjoin this player from its group."""
-        _LOGGER.warning("async_unjoin_player CALLED! Entity: %s, IP: %s", self.entity_id, self._ip_address)
+        _LOGGER.debug("Unjoining %s (%s)", self.entity_id, self._ip_address)
         
         success, _ = await send_upnp_command(
             self._ip_address,
             UPNP_AV_TRANSPORT,
             "BecomeCoordinatorOfStandaloneGroup",
-            "<InstanceID>0</InstanceID>",
+            INSTANCE_ARGS,
             CONTROL_AV_TRANSPORT,
+            session=self.coordinator.session,
         )
         
         if success:
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.group_refresh.async_call()
         else:
             _LOGGER.error("Failed to unjoin %s from group", self.entity_id)
 
+    async def async_update(self) -> None:
+        """Refresh the speaker when an update is requested explicitly."""
+        await self.coordinator.async_request_refresh()
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self._ip_address in self.coordinator.data:
-            self._speaker_info.update(self.coordinator.data[self._ip_address])
+    def _async_handle_speaker_update(self, data: dict[str, Any]) -> None:
+        """Handle changed data for this speaker."""
+        self._speaker_state = SpeakerState.from_data(data)
+        self._speaker_info.update(data)
+        self._last_update_success = self.coordinator.last_update_success
+        self.async_write_ha_state()
+
+    @callback
+    def _async_handle_coordinator_update(self) -> None:
+        """Write state when a poll fails or recovers; data changes are dispatched."""
+        if self.coordinator.last_update_success == self._last_update_success:
+            return
+        self._last_update_success = self.coordinator.last_update_success
         self.async_write_ha_state()
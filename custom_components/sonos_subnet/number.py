@@ -1,19 +1,21 @@
 """Number platform for Sonos Subnet Discovery - EQ Controls."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
 from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    SONOS_PORT,
     CONTROL_RENDERING,
     UPNP_RENDERING_CONTROL,
 )
@@ -22,6 +24,73 @@ from .helpers import send_upnp_command
 
 _LOGGER = logging.getLogger(__name__)
 
+# Slider moves within this window are sent as one command with the last value
+SET_VALUE_COOLDOWN = 0.15
+
+BASS_ARGS_TEMPLATE = "<InstanceID>0</InstanceID><DesiredBass>%d</DesiredBass>"
+TREBLE_ARGS_TEMPLATE = "<InstanceID>0</InstanceID><DesiredTreble>%d</DesiredTreble>"
+LEFT_VOLUME_ARGS_TEMPLATE = (
+    "<InstanceID>0</InstanceID><Channel>LF</Channel><DesiredVolume>%d</DesiredVolume>"
+)
+RIGHT_VOLUME_ARGS_TEMPLATE = (
+    "<InstanceID>0</InstanceID><Channel>RF</Channel><DesiredVolume>%d</DesiredVolume>"
+)
+
+
+@lru_cache(maxsize=256)
+def balance_channel_volumes(balance: int, volume: int) -> tuple[int, int]:
+    """Return the (left, right) channel volumes for a balance setting.
+
+    Balance -100 = full left, 0 = center, +100 = full right; the far
+    channel is scaled down and the near one stays at the master volume.
+    """
+    if balance < 0:
+        return volume, round(volume * (100 + balance) / 100)
+    return round(volume * (100 - balance) / 100), volume
+
+
+@dataclass(frozen=True, slots=True)
+class NumberSpec:
+    """Describe one speaker setting exposed as a slider."""
+
+    key: str
+    name: str
+    icon: str
+    # Single RenderingControl write; None when the entity sends its own
+    action: str | None = None
+    args_template: str | None = None
+    min_value: float = -10
+    max_value: float = 10
+    step: float = 1
+    unit: str | None = None
+
+
+BALANCE_NUMBER_SPEC = NumberSpec(
+    key="balance",
+    name="Balance",
+    icon="mdi:scale-balance",
+    min_value=-100,
+    max_value=100,
+    unit="%",
+)
+
+EQ_NUMBER_SPECS: tuple[NumberSpec, ...] = (
+    NumberSpec(
+        key="bass",
+        name="Bass",
+        action="SetBass",
+        args_template=BASS_ARGS_TEMPLATE,
+        icon="mdi:music-clef-bass",
+    ),
+    NumberSpec(
+        key="treble",
+        name="Treble",
+        action="SetTreble",
+        args_template=TREBLE_ARGS_TEMPLATE,
+        icon="mdi:music-clef-treble",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,15 +104,32 @@ async def async_setup_entry(
 
     for ip, speaker_info in coordinator.speakers.items():
         # Add EQ controls
-        entities.append(SonosBassNumber(coordinator, ip, speaker_info))
-        entities.append(SonosTrebleNumber(coordinator, ip, speaker_info))
+        entities.extend(
+            SonosBaseNumber(coordinator, ip, speaker_info, spec) for spec in EQ_NUMBER_SPECS
+        )
         entities.append(SonosBalanceNumber(coordinator, ip, speaker_info))
 
     async_add_entities(entities)
 
 
 class SonosBaseNumber(CoordinatorEntity[SonosSubnetCoordinator], NumberEntity):
-    """Base class for Sonos number entities."""
+    """A Sonos speaker setting exposed as a slider.
+
+    Settings with a single RenderingControl write (bass, treble) use this
+    class directly; subclasses override _async_send_value for anything else.
+    """
+
+    # Fields added by this class live in slots; base classes keep their __dict__
+    __slots__ = (
+        "_ip_address",
+        "_speaker_info",
+        "_spec",
+        "_key",
+        "_base_unique_id",
+        "_speaker_data",
+        "_pending_value",
+        "_set_debouncer",
+    )
 
     _attr_has_entity_name = True
     _attr_mode = NumberMode.SLIDER
@@ -53,46 +139,57 @@ class SonosBaseNumber(CoordinatorEntity[SonosSubnetCoordinator], NumberEntity):
         coordinator: SonosSubnetCoordinator,
         ip_address: str,
         speaker_info: dict[str, Any],
-        key: str,
-        name: str,
-        min_value: float,
-        max_value: float,
-        step: float = 1,
-        icon: str = "mdi:tune",
+        spec: NumberSpec,
     ) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
-        
+
         self._ip_address = ip_address
         self._speaker_info = speaker_info
-        self._key = key
+        self._spec = spec
+        self._key = spec.key
+        self._base_unique_id, self._attr_device_info = coordinator.get_device_meta(
+            ip_address, speaker_info
+        )
         # Prefix unique_id to avoid collision with built-in Sonos integration
-        self._base_unique_id = speaker_info.get("uuid") or speaker_info.get("serial_number") or ip_address
-        
-        self._attr_unique_id = f"sonos_subnet_{self._base_unique_id}_{key}"
-        self._attr_name = name
-        self._attr_native_min_value = min_value
-        self._attr_native_max_value = max_value
-        self._attr_native_step = step
-        self._attr_icon = icon
+        self._attr_unique_id = f"sonos_subnet_{self._base_unique_id}_{spec.key}"
+        # Refreshed on each coordinator update so state reads are one lookup
+        self._speaker_data = self._current_speaker_data()
+        self._attr_name = spec.name
+        self._attr_native_min_value = spec.min_value
+        self._attr_native_max_value = spec.max_value
+        self._attr_native_step = spec.step
+        self._attr_native_unit_of_measurement = spec.unit
+        self._attr_icon = spec.icon
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._base_unique_id)},
-            name=self._speaker_info.get("zone_name", f"Sonos ({self._ip_address})"),
-            manufacturer="Sonos",
-            model=self._speaker_info.get("model_name", "Unknown"),
+        # Latest slider value waiting to be sent
+        self._pending_value: float | None = None
+        self._set_debouncer: Debouncer | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up the slider debouncer once the entity has hass."""
+        await super().async_added_to_hass()
+        self._set_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=SET_VALUE_COOLDOWN,
+            immediate=False,
+            function=self._async_flush_value,
         )
+        self.async_on_remove(self._set_debouncer.async_cancel)
 
-    @property
-    def _speaker_data(self) -> dict[str, Any]:
+    def _current_speaker_data(self) -> dict[str, Any]:
         """Return current speaker data from coordinator."""
         if self.coordinator.data:
             return self.coordinator.data.get(self._ip_address, {})
         return {}
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Snapshot this speaker's data once per coordinator update."""
+        self._speaker_data = self._current_speaker_data()
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return if the entity is available."""
@@ -103,82 +200,46 @@ class SonosBaseNumber(CoordinatorEntity[SonosSubnetCoordinator], NumberEntity):
         """Return the current value."""
         return self._speaker_data.get(self._key)
 
-
-class SonosBassNumber(SonosBaseNumber):
-    """Bass control for Sonos speakers."""
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize bass number."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="bass",
-            name="Bass",
-            min_value=-10,
-            max_value=10,
-            step=1,
-            icon="mdi:music-clef-bass",
-        )
-
     async def async_set_native_value(self, value: float) -> None:
-        """Set the bass value."""
-        _LOGGER.info("Setting bass to %d on %s", int(value), self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetBass",
-            f"<InstanceID>0</InstanceID><DesiredBass>{int(value)}</DesiredBass>",
-            CONTROL_RENDERING,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
+        """Queue a new value; a burst of slider moves sends only the last one."""
+        self._pending_value = value
+        await self._set_debouncer.async_call()
 
-class SonosTrebleNumber(SonosBaseNumber):
-    """Treble control for Sonos speakers."""
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize treble number."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="treble",
-            name="Treble",
-            min_value=-10,
-            max_value=10,
-            step=1,
-            icon="mdi:music-clef-treble",
-        )
+    async def _async_flush_value(self) -> None:
+        """Send the latest queued value and show it on success."""
+        if (value := self._pending_value) is None:
+            return
+        self._pending_value = None
+        # A slider dragged back to where it started needs no command
+        current = self._speaker_data.get(self._key)
+        if current is not None and int(current) == int(value):
+            return
+        if await self._async_send_value(value):
+            # The next poll or event confirms it; no need to wait for one
+            self._speaker_data[self._key] = int(value)
+            self.async_write_ha_state()
+            await self.coordinator.async_refresh_after_command(self._ip_address)
 
-    async def async_set_native_value(self, value: float) -> None:
-        """Set the treble value."""
-        _LOGGER.info("Setting treble to %d on %s", int(value), self._ip_address)
+    async def _async_send_value(self, value: float) -> bool:
+        """Send a value to the speaker, returning True on success."""
+        spec = self._spec
+        _LOGGER.debug("Setting %s to %d on %s", spec.key, value, self._ip_address)
         success, _ = await send_upnp_command(
             self._ip_address,
             UPNP_RENDERING_CONTROL,
-            "SetTreble",
-            f"<InstanceID>0</InstanceID><DesiredTreble>{int(value)}</DesiredTreble>",
+            spec.action,
+            spec.args_template % value,
             CONTROL_RENDERING,
+            session=self.coordinator.session,
         )
-        if success:
-            await self.coordinator.async_request_refresh()
+        return success
 
 
 class SonosBalanceNumber(SonosBaseNumber):
     """Balance control for Sonos speakers."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: SonosSubnetCoordinator,
@@ -186,68 +247,55 @@ class SonosBalanceNumber(SonosBaseNumber):
         speaker_info: dict[str, Any],
     ) -> None:
         """Initialize balance number."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="balance",
-            name="Balance",
-            min_value=-100,
-            max_value=100,
-            step=1,
-            icon="mdi:scale-balance",
-        )
-        self._attr_native_unit_of_measurement = "%"
+        super().__init__(coordinator, ip_address, speaker_info, BALANCE_NUMBER_SPEC)
 
     @property
     def native_value(self) -> float | None:
         """Return the current balance value.
-        
+
         Balance is calculated from left/right volume difference.
         Negative = left, Positive = right.
         """
         # Balance might not be directly available, return 0 as default
         return self._speaker_data.get("balance", 0)
 
-    async def async_set_native_value(self, value: float) -> None:
+    async def _async_send_value(self, value: float) -> bool:
         """Set the balance value.
-        
+
         This adjusts the relative volume of left and right channels.
         """
-        _LOGGER.info("Setting balance to %d on %s", int(value), self._ip_address)
-        
-        # Calculate left/right volumes based on balance
-        # Balance -100 = full left, 0 = center, +100 = full right
-        base_volume = self._speaker_data.get("volume", 50)
-        
-        if value < 0:
-            # Reduce right channel
-            left_vol = base_volume
-            right_vol = int(base_volume * (100 + value) / 100)
-        elif value > 0:
-            # Reduce left channel
-            left_vol = int(base_volume * (100 - value) / 100)
-            right_vol = base_volume
-        else:
-            left_vol = base_volume
-            right_vol = base_volume
-        
-        # Set left channel volume
-        await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetVolume",
-            f"<InstanceID>0</InstanceID><Channel>LF</Channel><DesiredVolume>{left_vol}</DesiredVolume>",
-            CONTROL_RENDERING,
-        )
-        
-        # Set right channel volume
-        await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetVolume",
-            f"<InstanceID>0</InstanceID><Channel>RF</Channel><DesiredVolume>{right_vol}</DesiredVolume>",
-            CONTROL_RENDERING,
+        _LOGGER.debug("Setting balance to %d on %s", value, self._ip_address)
+
+        if (base_volume := self._speaker_data.get("volume")) is None:
+            base_volume = 50
+        left_vol, right_vol = balance_channel_volumes(int(value), int(base_volume))
+
+        # Both channels are independent; set them together
+        (left_ok, _), (right_ok, _) = await asyncio.gather(
+            send_upnp_command(
+                self._ip_address,
+                UPNP_RENDERING_CONTROL,
+                "SetVolume",
+                LEFT_VOLUME_ARGS_TEMPLATE % left_vol,
+                CONTROL_RENDERING,
+                session=self.coordinator.session,
+            ),
+            send_upnp_command(
+                self._ip_address,
+                UPNP_RENDERING_CONTROL,
+                "SetVolume",
+                RIGHT_VOLUME_ARGS_TEMPLATE % right_vol,
+                CONTROL_RENDERING,
+                session=self.coordinator.session,
+            ),
         )
-        
-        await self.coordinator.async_request_refresh()
+
+        # A half-applied balance is not the requested one; let the next poll show it
+        for channel, ok in (("LF", left_ok), ("RF", right_ok)):
+            if not ok:
+                _LOGGER.warning(
+                    "Setting %s channel volume for balance failed on %s",
+                    channel,
+                    self._ip_address,
+                )
+        return left_ok and right_ok
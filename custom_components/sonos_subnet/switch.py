@@ -1,13 +1,14 @@
 """Switch platform for Sonos Subnet Discovery."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -25,6 +26,113 @@ from .helpers import send_upnp_command
 
 _LOGGER = logging.getLogger(__name__)
 
+# The first toggle is sent at once; later ones in this window send only the last
+TOGGLE_COOLDOWN = 0.5
+
+# Fixed action arguments; identical bodies also hit the SOAP request cache
+CROSSFADE_ON_ARGS = "<InstanceID>0</InstanceID><CrossfadeMode>1</CrossfadeMode>"
+CROSSFADE_OFF_ARGS = "<InstanceID>0</InstanceID><CrossfadeMode>0</CrossfadeMode>"
+LOUDNESS_ON_ARGS = "<InstanceID>0</InstanceID><Channel>Master</Channel><DesiredLoudness>1</DesiredLoudness>"
+LOUDNESS_OFF_ARGS = "<InstanceID>0</InstanceID><Channel>Master</Channel><DesiredLoudness>0</DesiredLoudness>"
+LED_ON_ARGS = "<DesiredLEDState>On</DesiredLEDState>"
+LED_OFF_ARGS = "<DesiredLEDState>Off</DesiredLEDState>"
+BUTTON_UNLOCK_ARGS = "<DesiredButtonLockState>Off</DesiredButtonLockState>"
+BUTTON_LOCK_ARGS = "<DesiredButtonLockState>On</DesiredButtonLockState>"
+NIGHT_MODE_ON_ARGS = "<InstanceID>0</InstanceID><EQType>NightMode</EQType><DesiredValue>1</DesiredValue>"
+NIGHT_MODE_OFF_ARGS = "<InstanceID>0</InstanceID><EQType>NightMode</EQType><DesiredValue>0</DesiredValue>"
+DIALOG_LEVEL_ON_ARGS = "<InstanceID>0</InstanceID><EQType>DialogLevel</EQType><DesiredValue>1</DesiredValue>"
+DIALOG_LEVEL_OFF_ARGS = "<InstanceID>0</InstanceID><EQType>DialogLevel</EQType><DesiredValue>0</DesiredValue>"
+
+
+@dataclass(frozen=True, slots=True)
+class SwitchSpec:
+    """Describe one speaker setting exposed as a switch."""
+
+    key: str
+    name: str
+    service: str
+    control_path: str
+    action: str
+    args_on: str
+    args_off: str
+    icon_on: str
+    icon_off: str
+    enabled_default: bool = True
+
+
+SWITCH_SPECS: tuple[SwitchSpec, ...] = (
+    SwitchSpec(
+        key="crossfade",
+        name="Crossfade",
+        service=UPNP_AV_TRANSPORT,
+        control_path=CONTROL_AV_TRANSPORT,
+        action="SetCrossfadeMode",
+        args_on=CROSSFADE_ON_ARGS,
+        args_off=CROSSFADE_OFF_ARGS,
+        icon_on="mdi:swap-horizontal",
+        icon_off="mdi:swap-horizontal",
+    ),
+    SwitchSpec(
+        key="loudness",
+        name="Loudness",
+        service=UPNP_RENDERING_CONTROL,
+        control_path=CONTROL_RENDERING,
+        action="SetLoudness",
+        args_on=LOUDNESS_ON_ARGS,
+        args_off=LOUDNESS_OFF_ARGS,
+        icon_on="mdi:volume-vibrate",
+        icon_off="mdi:volume-off",
+    ),
+    SwitchSpec(
+        key="status_light",
+        name="Status Light",
+        service=UPNP_DEVICE_PROPERTIES,
+        control_path=CONTROL_DEVICE_PROPERTIES,
+        action="SetLEDState",
+        args_on=LED_ON_ARGS,
+        args_off=LED_OFF_ARGS,
+        icon_on="mdi:led-on",
+        icon_off="mdi:led-off",
+    ),
+    # Touch controls are on when the buttons are unlocked
+    SwitchSpec(
+        key="touch_controls",
+        name="Touch Controls",
+        service=UPNP_DEVICE_PROPERTIES,
+        control_path=CONTROL_DEVICE_PROPERTIES,
+        action="SetButtonLockState",
+        args_on=BUTTON_UNLOCK_ARGS,
+        args_off=BUTTON_LOCK_ARGS,
+        icon_on="mdi:gesture-tap",
+        icon_off="mdi:gesture-tap-hold",
+    ),
+    # Night mode and Speech Enhancement are only for soundbars
+    SwitchSpec(
+        key="night_mode",
+        name="Night Mode",
+        service=UPNP_RENDERING_CONTROL,
+        control_path=CONTROL_RENDERING,
+        action="SetEQ",
+        args_on=NIGHT_MODE_ON_ARGS,
+        args_off=NIGHT_MODE_OFF_ARGS,
+        icon_on="mdi:weather-night",
+        icon_off="mdi:weather-sunny",
+        enabled_default=False,
+    ),
+    SwitchSpec(
+        key="speech_enhancement",
+        name="Speech Enhancement",
+        service=UPNP_RENDERING_CONTROL,
+        control_path=CONTROL_RENDERING,
+        action="SetEQ",
+        args_on=DIALOG_LEVEL_ON_ARGS,
+        args_off=DIALOG_LEVEL_OFF_ARGS,
+        icon_on="mdi:account-voice",
+        icon_off="mdi:account-voice-off",
+        enabled_default=False,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,22 +142,27 @@ async def async_setup_entry(
     """Set up Sonos switch entities from a config entry."""
     coordinator: SonosSubnetCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SwitchEntity] = []
-
-    for ip, speaker_info in coordinator.speakers.items():
-        entities.append(SonosCrossfadeSwitch(coordinator, ip, speaker_info))
-        entities.append(SonosLoudnessSwitch(coordinator, ip, speaker_info))
-        entities.append(SonosStatusLightSwitch(coordinator, ip, speaker_info))
-        entities.append(SonosTouchControlsSwitch(coordinator, ip, speaker_info))
-        # Night mode and Speech Enhancement are only for soundbars
-        entities.append(SonosNightModeSwitch(coordinator, ip, speaker_info))
-        entities.append(SonosSpeechEnhancementSwitch(coordinator, ip, speaker_info))
+    async_add_entities(
+        SonosSwitch(coordinator, ip, speaker_info, spec)
+        for ip, speaker_info in coordinator.speakers.items()
+        for spec in SWITCH_SPECS
+    )
 
-    async_add_entities(entities)
 
+class SonosSwitch(CoordinatorEntity[SonosSubnetCoordinator], SwitchEntity):
+    """A Sonos speaker setting exposed as a switch."""
 
-class SonosBaseSwitch(CoordinatorEntity[SonosSubnetCoordinator], SwitchEntity):
-    """Base class for Sonos switch entities."""
+    # Fields added by this class live in slots; base classes keep their __dict__
+    __slots__ = (
+        "_ip_address",
+        "_speaker_info",
+        "_spec",
+        "_key",
+        "_base_unique_id",
+        "_speaker_data",
+        "_pending_state",
+        "_toggle_debouncer",
+    )
 
     _attr_has_entity_name = True
 
@@ -58,42 +171,53 @@ class SonosBaseSwitch(CoordinatorEntity[SonosSubnetCoordinator], SwitchEntity):
         coordinator: SonosSubnetCoordinator,
         ip_address: str,
         speaker_info: dict[str, Any],
-        key: str,
-        name: str,
-        icon_on: str = "mdi:toggle-switch",
-        icon_off: str = "mdi:toggle-switch-off",
+        spec: SwitchSpec,
     ) -> None:
         """Initialize the switch entity."""
         super().__init__(coordinator)
-        
+
         self._ip_address = ip_address
         self._speaker_info = speaker_info
-        self._key = key
-        self._icon_on = icon_on
-        self._icon_off = icon_off
+        self._spec = spec
+        self._key = spec.key
+        self._base_unique_id, self._attr_device_info = coordinator.get_device_meta(
+            ip_address, speaker_info
+        )
         # Prefix unique_id to avoid collision with built-in Sonos integration
-        self._base_unique_id = speaker_info.get("uuid") or speaker_info.get("serial_number") or ip_address
-        
-        self._attr_unique_id = f"sonos_subnet_{self._base_unique_id}_{key}"
-        self._attr_name = name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._base_unique_id)},
-            name=self._speaker_info.get("zone_name", f"Sonos ({self._ip_address})"),
-            manufacturer="Sonos",
-            model=self._speaker_info.get("model_name", "Unknown"),
+        self._attr_unique_id = f"sonos_subnet_{self._base_unique_id}_{spec.key}"
+        # Refreshed on each coordinator update so state reads are one lookup
+        self._speaker_data = self._current_speaker_data()
+        self._attr_name = spec.name
+        self._attr_entity_registry_enabled_default = spec.enabled_default
+
+        # Latest requested state waiting to be sent
+        self._pending_state: bool | None = None
+        self._toggle_debouncer: Debouncer | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up the toggle debouncer once the entity has hass."""
+        await super().async_added_to_hass()
+        self._toggle_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=TOGGLE_COOLDOWN,
+            immediate=True,
+            function=self._async_flush_state,
         )
+        self.async_on_remove(self._toggle_debouncer.async_cancel)
 
-    @property
-    def _speaker_data(self) -> dict[str, Any]:
+    def _current_speaker_data(self) -> dict[str, Any]:
         """Return current speaker data from coordinator."""
         if self.coordinator.data:
             return self.coordinator.data.get(self._ip_address, {})
         return {}
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Snapshot this speaker's data once per coordinator update."""
+        self._speaker_data = self._current_speaker_data()
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return if the entity is available."""
@@ -110,290 +234,42 @@ class SonosBaseSwitch(CoordinatorEntity[SonosSubnetCoordinator], SwitchEntity):
     @property
     def icon(self) -> str:
         """Return the icon."""
-        return self._icon_on if self.is_on else self._icon_off
-
-
-class SonosCrossfadeSwitch(SonosBaseSwitch):
-    """Crossfade switch for Sonos speakers."""
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize crossfade switch."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="crossfade",
-            name="Crossfade",
-            icon_on="mdi:swap-horizontal",
-            icon_off="mdi:swap-horizontal",
-        )
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on crossfade."""
-        _LOGGER.info("Enabling crossfade on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_AV_TRANSPORT,
-            "SetCrossfadeMode",
-            "<InstanceID>0</InstanceID><CrossfadeMode>1</CrossfadeMode>",
-            CONTROL_AV_TRANSPORT,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off crossfade."""
-        _LOGGER.info("Disabling crossfade on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_AV_TRANSPORT,
-            "SetCrossfadeMode",
-            "<InstanceID>0</InstanceID><CrossfadeMode>0</CrossfadeMode>",
-            CONTROL_AV_TRANSPORT,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-
-class SonosLoudnessSwitch(SonosBaseSwitch):
-    """Loudness switch for Sonos speakers."""
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize loudness switch."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="loudness",
-            name="Loudness",
-            icon_on="mdi:volume-vibrate",
-            icon_off="mdi:volume-off",
-        )
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on loudness."""
-        _LOGGER.info("Enabling loudness on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetLoudness",
-            "<InstanceID>0</InstanceID><Channel>Master</Channel><DesiredLoudness>1</DesiredLoudness>",
-            CONTROL_RENDERING,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off loudness."""
-        _LOGGER.info("Disabling loudness on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetLoudness",
-            "<InstanceID>0</InstanceID><Channel>Master</Channel><DesiredLoudness>0</DesiredLoudness>",
-            CONTROL_RENDERING,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-
-class SonosStatusLightSwitch(SonosBaseSwitch):
-    """Status light switch for Sonos speakers."""
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize status light switch."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="status_light",
-            name="Status Light",
-            icon_on="mdi:led-on",
-            icon_off="mdi:led-off",
-        )
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on status light."""
-        _LOGGER.info("Enabling status light on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_DEVICE_PROPERTIES,
-            "SetLEDState",
-            "<DesiredLEDState>On</DesiredLEDState>",
-            CONTROL_DEVICE_PROPERTIES,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off status light."""
-        _LOGGER.info("Disabling status light on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_DEVICE_PROPERTIES,
-            "SetLEDState",
-            "<DesiredLEDState>Off</DesiredLEDState>",
-            CONTROL_DEVICE_PROPERTIES,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-
-class SonosTouchControlsSwitch(SonosBaseSwitch):
-    """Touch controls switch for Sonos speakers."""
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize touch controls switch."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="touch_controls",
-            name="Touch Controls",
-            icon_on="mdi:gesture-tap",
-            icon_off="mdi:gesture-tap-hold",
-        )
+        return self._spec.icon_on if self.is_on else self._spec.icon_off
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Enable touch controls (unlock buttons)."""
-        _LOGGER.info("Enabling touch controls on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_DEVICE_PROPERTIES,
-            "SetButtonLockState",
-            "<DesiredButtonLockState>Off</DesiredButtonLockState>",
-            CONTROL_DEVICE_PROPERTIES,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
+        """Turn the setting on."""
+        await self._async_request_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Disable touch controls (lock buttons)."""
-        _LOGGER.info("Disabling touch controls on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_DEVICE_PROPERTIES,
-            "SetButtonLockState",
-            "<DesiredButtonLockState>On</DesiredButtonLockState>",
-            CONTROL_DEVICE_PROPERTIES,
+        """Turn the setting off."""
+        await self._async_request_state(False)
+
+    async def _async_request_state(self, state: bool) -> None:
+        """Queue a state; rapid toggles send the first and the last only."""
+        self._pending_state = state
+        await self._toggle_debouncer.async_call()
+
+    async def _async_flush_state(self) -> None:
+        """Send the latest queued state and show it on success."""
+        if (state := self._pending_state) is None:
+            return
+        self._pending_state = None
+        spec = self._spec
+        if self._speaker_data.get(spec.key) is state:
+            return
+        _LOGGER.debug(
+            "%s %s on %s", "Enabling" if state else "Disabling", spec.key, self._ip_address
         )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-
-class SonosNightModeSwitch(SonosBaseSwitch):
-    """Night mode switch for Sonos soundbars."""
-
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize night mode switch."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="night_mode",
-            name="Night Mode",
-            icon_on="mdi:weather-night",
-            icon_off="mdi:weather-sunny",
-        )
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on night mode."""
-        _LOGGER.info("Enabling night mode on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetEQ",
-            "<InstanceID>0</InstanceID><EQType>NightMode</EQType><DesiredValue>1</DesiredValue>",
-            CONTROL_RENDERING,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off night mode."""
-        _LOGGER.info("Disabling night mode on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetEQ",
-            "<InstanceID>0</InstanceID><EQType>NightMode</EQType><DesiredValue>0</DesiredValue>",
-            CONTROL_RENDERING,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-
-class SonosSpeechEnhancementSwitch(SonosBaseSwitch):
-    """Speech enhancement switch for Sonos soundbars."""
-
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(
-        self,
-        coordinator: SonosSubnetCoordinator,
-        ip_address: str,
-        speaker_info: dict[str, Any],
-    ) -> None:
-        """Initialize speech enhancement switch."""
-        super().__init__(
-            coordinator,
-            ip_address,
-            speaker_info,
-            key="speech_enhancement",
-            name="Speech Enhancement",
-            icon_on="mdi:account-voice",
-            icon_off="mdi:account-voice-off",
-        )
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on speech enhancement."""
-        _LOGGER.info("Enabling speech enhancement on %s", self._ip_address)
-        success, _ = await send_upnp_command(
-            self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetEQ",
-            "<InstanceID>0</InstanceID><EQType>DialogLevel</EQType><DesiredValue>1</DesiredValue>",
-            CONTROL_RENDERING,
-        )
-        if success:
-            await self.coordinator.async_request_refresh()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off speech enhancement."""
-        _LOGGER.info("Disabling speech enhancement on %s", self._ip_address)
         success, _ = await send_upnp_command(
             self._ip_address,
-            UPNP_RENDERING_CONTROL,
-            "SetEQ",
-            "<InstanceID>0</InstanceID><EQType>DialogLevel</EQType><DesiredValue>0</DesiredValue>",
-            CONTROL_RENDERING,
+            spec.service,
+            spec.action,
+            spec.args_on if state else spec.args_off,
+            spec.control_path,
+            session=self.coordinator.session,
         )
         if success:
-            await self.coordinator.async_request_refresh()
+            # The next poll or event confirms it; no need to wait for one
+            self._speaker_data[spec.key] = state
+            self.async_write_ha_state()
+            await self.coordinator.async_refresh_after_command(self._ip_address)
@@ -0,0 +1 @@
+"""Tests for the Sonos Subnet Discovery integration."""
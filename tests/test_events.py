@@ -0,0 +1,212 @@
+"""Tests for the Sonos Subnet Discovery event listener."""
+from __future__ import annotations
+
+from html import escape
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from custom_components.sonos_subnet.events import (
+    EVENT_PATHS,
+    SonosEventListener,
+    parse_last_change,
+)
+
+SPEAKER_IP = "192.168.20.31"
+
+TRACK_DIDL = (
+    '<DIDL-Lite xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/" '
+    'xmlns:r="urn:schemas-rinconnetworks-com:metadata-1-0/" '
+    'xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/">'
+    '<item id="-1" parentID="-1" restricted="true">'
+    '<res protocolInfo="sonos.com-http:*:audio/mp4:*" duration="0:04:11"></res>'
+    "<upnp:albumArtURI>/getaa?s=1&amp;u=x-sonos-http</upnp:albumArtURI>"
+    "<dc:title>Paranoid Android</dc:title>"
+    "<dc:creator>Radiohead</dc:creator>"
+    "<upnp:album>OK Computer</upnp:album>"
+    "</item></DIDL-Lite>"
+)
+
+# LastChange documents as sent by a Sonos One (S2)
+AV_TRANSPORT_LAST_CHANGE = (
+    '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/AVT/" '
+    'xmlns:r="urn:schemas-rinconnetworks-com:metadata-1-0/">'
+    '<InstanceID val="0">'
+    '<TransportState val="PLAYING"/>'
+    '<CurrentPlayMode val="SHUFFLE_REPEAT_ONE"/>'
+    '<CurrentCrossfadeMode val="1"/>'
+    '<NumberOfTracks val="12"/>'
+    '<CurrentTrack val="3"/>'
+    '<CurrentSection val="0"/>'
+    '<CurrentTrackURI val="x-sonos-spotify:spotify%3atrack%3a6LgJvl0Xdtc73RJ1mmpotq"/>'
+    '<CurrentTrackDuration val="0:04:11"/>'
+    f'<CurrentTrackMetaData val="{escape(TRACK_DIDL)}"/>'
+    '<r:NextTrackURI val=""/>'
+    '<r:EnqueuedTransportURI val="x-rincon-queue:RINCON_000E58A1B2C301400#0"/>'
+    '<PlaybackStorageMedium val="NETWORK"/>'
+    "</InstanceID></Event>"
+)
+RENDERING_CONTROL_LAST_CHANGE = (
+    '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/RCS/">'
+    '<InstanceID val="0">'
+    '<Volume channel="Master" val="32"/>'
+    '<Volume channel="LF" val="100"/>'
+    '<Volume channel="RF" val="100"/>'
+    '<Mute channel="Master" val="0"/>'
+    '<Mute channel="LF" val="1"/>'
+    '<Mute channel="RF" val="1"/>'
+    '<Bass val="2"/>'
+    '<Treble val="-1"/>'
+    '<Loudness channel="Master" val="1"/>'
+    '<Loudness channel="LF" val="0"/>'
+    '<OutputFixed val="0"/>'
+    '<HeadphoneConnected val="0"/>'
+    '<SubEnabled val="1"/>'
+    "</InstanceID></Event>"
+)
+
+
+def _notify_body(last_change: str) -> bytes:
+    """Wrap a LastChange document in a GENA property set."""
+    return (
+        '<?xml version="1.0"?>'
+        '<e:propertyset xmlns:e="urn:schemas-upnp-org:event-1-0"><e:property>'
+        f"<LastChange>{escape(last_change)}</LastChange>"
+        "</e:property></e:propertyset>"
+    ).encode()
+
+
+def _notify_request(sid: str, body: bytes = b"") -> MagicMock:
+    """Return a NOTIFY request for the given subscription."""
+    request = MagicMock()
+    request.headers = {"SID": sid, "NT": "upnp:event", "NTS": "upnp:propchange"}
+    request.read = AsyncMock(return_value=body)
+    return request
+
+
+@pytest.fixture
+def on_event() -> Mock:
+    """Return the event callback handed to the listener."""
+    return Mock()
+
+
+@pytest.fixture
+def listener(on_event: Mock) -> SonosEventListener:
+    """Return a listener with both services of one speaker subscribed."""
+    listener = SonosEventListener(MagicMock(), MagicMock(), on_event, 1410)
+    for index, path in enumerate(EVENT_PATHS):
+        sid = f"uuid:RINCON_000E58A1B2C301400_sub000000{index}"
+        listener._speaker_sids.setdefault(SPEAKER_IP, {})[path] = sid
+        listener._sid_index[sid] = (SPEAKER_IP, path)
+    return listener
+
+
+def test_parse_last_change_av_transport() -> None:
+    """Test transport state, play mode and track details are read."""
+    changes = parse_last_change(AV_TRANSPORT_LAST_CHANGE)
+
+    assert changes == {
+        "transport_state": "PLAYING",
+        "shuffle": True,
+        "repeat": True,
+        "repeat_one": True,
+        "crossfade": True,
+        "track_number": 3,
+        "track_uri": "x-sonos-spotify:spotify%3atrack%3a6LgJvl0Xdtc73RJ1mmpotq",
+        "track_duration": 251,
+        "track_title": "Paranoid Android",
+        "track_artist": "Radiohead",
+        "track_album": "OK Computer",
+        "album_art_uri": "/getaa?s=1&u=x-sonos-http",
+    }
+
+
+def test_parse_last_change_master_channel_only() -> None:
+    """Test per-channel values only come from the Master channel."""
+    changes = parse_last_change(RENDERING_CONTROL_LAST_CHANGE)
+
+    assert changes == {
+        "volume": 32,
+        "mute": False,
+        "bass": 2,
+        "treble": -1,
+        "loudness": True,
+    }
+
+
+@pytest.mark.parametrize(
+    ("play_mode", "shuffle", "repeat", "repeat_one"),
+    [
+        ("NORMAL", False, False, False),
+        ("REPEAT_ALL", False, True, False),
+        ("REPEAT_ONE", False, True, True),
+        ("SHUFFLE_NOREPEAT", True, False, False),
+        ("SHUFFLE", True, True, False),
+        ("SHUFFLE_REPEAT_ONE", True, True, True),
+    ],
+)
+def test_parse_last_change_play_mode(
+    play_mode: str, shuffle: bool, repeat: bool, repeat_one: bool
+) -> None:
+    """Test each play mode maps onto shuffle and repeat."""
+    changes = parse_last_change(
+        '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/AVT/"><InstanceID val="0">'
+        f'<CurrentPlayMode val="{play_mode}"/></InstanceID></Event>'
+    )
+
+    assert changes == {"shuffle": shuffle, "repeat": repeat, "repeat_one": repeat_one}
+
+
+@pytest.mark.parametrize("last_change", ["", "<Event><InstanceID val="])
+def test_parse_last_change_empty_or_invalid(last_change: str) -> None:
+    """Test missing or unparsable documents give no changes."""
+    assert parse_last_change(last_change) == {}
+
+
+@pytest.mark.asyncio
+async def test_notify_unknown_sid(listener: SonosEventListener, on_event: Mock) -> None:
+    """Test a NOTIFY for an unknown subscription is refused."""
+    request = _notify_request("uuid:RINCON_unknown", _notify_body(RENDERING_CONTROL_LAST_CHANGE))
+
+    response = await listener._handle_notify(request)
+
+    assert response.status == 412
+    on_event.assert_not_called()
+    assert not listener.is_live(SPEAKER_IP)
+
+
+@pytest.mark.asyncio
+async def test_notify_makes_speaker_live(listener: SonosEventListener, on_event: Mock) -> None:
+    """Test a speaker is live once every subscription has notified."""
+    av_sid, rendering_sid = listener._speaker_sids[SPEAKER_IP].values()
+    assert listener.is_subscribed(SPEAKER_IP)
+    assert not listener.is_live(SPEAKER_IP)
+
+    response = await listener._handle_notify(
+        _notify_request(av_sid, _notify_body(AV_TRANSPORT_LAST_CHANGE))
+    )
+    assert response.status == 200
+    assert not listener.is_live(SPEAKER_IP)
+    on_event.assert_called_once()
+    assert on_event.call_args.args[0] == SPEAKER_IP
+    assert on_event.call_args.args[1]["transport_state"] == "PLAYING"
+
+    response = await listener._handle_notify(
+        _notify_request(rendering_sid, _notify_body(RENDERING_CONTROL_LAST_CHANGE))
+    )
+    assert response.status == 200
+    assert listener.is_live(SPEAKER_IP)
+    assert on_event.call_args.args == (SPEAKER_IP, parse_last_change(RENDERING_CONTROL_LAST_CHANGE))
+
+
+@pytest.mark.asyncio
+async def test_notify_without_changes(listener: SonosEventListener, on_event: Mock) -> None:
+    """Test an empty NOTIFY still confirms the subscription."""
+    sid = listener._speaker_sids[SPEAKER_IP][EVENT_PATHS[0]]
+
+    response = await listener._handle_notify(_notify_request(sid))
+
+    assert response.status == 200
+    assert sid in listener._confirmed
+    on_event.assert_not_called()
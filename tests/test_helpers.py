@@ -0,0 +1,143 @@
+"""Tests for the Sonos Subnet Discovery helpers."""
+from __future__ import annotations
+
+from html import escape
+
+import pytest
+
+from custom_components.sonos_subnet.helpers import (
+    XML_FEED_CHUNK,
+    format_duration,
+    parse_didl_metadata,
+    parse_duration,
+    parse_play_mode,
+    parse_xml_values,
+)
+
+GET_TRANSPORT_INFO_RESPONSE = (
+    '<?xml version="1.0"?>'
+    '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" '
+    's:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/"><s:Body>'
+    '<u:GetTransportInfoResponse xmlns:u="urn:schemas-upnp-org:service:AVTransport:1">'
+    "<CurrentTransportState>PLAYING</CurrentTransportState>"
+    "<CurrentTransportStatus>OK</CurrentTransportStatus>"
+    "<CurrentSpeed>1</CurrentSpeed>"
+    "</u:GetTransportInfoResponse></s:Body></s:Envelope>"
+)
+
+TRACK_DIDL = (
+    '<DIDL-Lite xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/" '
+    'xmlns:r="urn:schemas-rinconnetworks-com:metadata-1-0/" '
+    'xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/">'
+    '<item id="-1" parentID="-1" restricted="true">'
+    '<res protocolInfo="sonos.com-http:*:audio/mp4:*" duration="0:04:11"></res>'
+    "<r:streamContent></r:streamContent>"
+    "<upnp:albumArtURI>/getaa?s=1&amp;u=x-sonos-http</upnp:albumArtURI>"
+    "<dc:title>Paranoid Android</dc:title>"
+    "<upnp:class>object.item.audioItem.musicTrack</upnp:class>"
+    "<dc:creator>Radiohead</dc:creator>"
+    "<upnp:album>OK Computer</upnp:album>"
+    "</item></DIDL-Lite>"
+)
+
+
+def test_parse_xml_values_strips_namespaces() -> None:
+    """Test every element is collected by its local name."""
+    values = parse_xml_values(GET_TRANSPORT_INFO_RESPONSE)
+
+    assert values["CurrentTransportState"] == "PLAYING"
+    assert values["CurrentTransportStatus"] == "OK"
+    assert values["CurrentSpeed"] == "1"
+    assert "GetTransportInfoResponse" in values
+
+
+def test_parse_xml_values_only_wanted_tags() -> None:
+    """Test only the requested tags are returned."""
+    values = parse_xml_values(
+        GET_TRANSPORT_INFO_RESPONSE.encode(), ("CurrentTransportState", "CurrentSpeed")
+    )
+
+    assert values == {"CurrentTransportState": "PLAYING", "CurrentSpeed": "1"}
+
+
+def test_parse_xml_values_first_occurrence_wins() -> None:
+    """Test a repeated tag keeps its first value."""
+    values = parse_xml_values("<r><A> 1 </A><A>2</A></r>")
+
+    assert values["A"] == "1"
+
+
+def test_parse_xml_values_stops_after_wanted_tags() -> None:
+    """Test the body past the wanted tags is not parsed."""
+    # Broken XML well after the tag would fail a full parse
+    xml_text = "<r><A>1</A>" + " " * XML_FEED_CHUNK * 2 + "<B></C></r>"
+
+    assert parse_xml_values(xml_text, ("A",)) == {"A": "1"}
+    assert parse_xml_values(xml_text) == {}
+
+
+def test_parse_xml_values_unescapes_payloads() -> None:
+    """Test entity-escaped payloads come back as XML text."""
+    values = parse_xml_values(f"<r><TrackMetaData>{escape(TRACK_DIDL)}</TrackMetaData></r>")
+
+    assert values["TrackMetaData"] == TRACK_DIDL
+
+
+def test_parse_xml_values_invalid() -> None:
+    """Test invalid XML gives an empty result."""
+    assert parse_xml_values("<r><A>1</B></r>") == {}
+
+
+def test_parse_didl_metadata() -> None:
+    """Test track details are read from DIDL-Lite metadata."""
+    metadata = parse_didl_metadata(TRACK_DIDL)
+
+    assert metadata["title"] == "Paranoid Android"
+    assert metadata["artist"] == "Radiohead"
+    assert metadata["album"] == "OK Computer"
+    assert metadata["album_art"] == "/getaa?s=1&u=x-sonos-http"
+    assert metadata["duration_str"] == "0:04:11"
+    assert metadata["stream_content"] == ""
+    assert metadata["radio_show"] is None
+
+
+def test_parse_didl_metadata_escaped() -> None:
+    """Test metadata that is still entity-escaped is unescaped first."""
+    assert parse_didl_metadata(escape(TRACK_DIDL)) == parse_didl_metadata(TRACK_DIDL)
+
+
+@pytest.mark.parametrize("didl", ["", "NOT_IMPLEMENTED", "<DIDL-Lite>"])
+def test_parse_didl_metadata_empty_or_invalid(didl: str) -> None:
+    """Test missing or unparsable metadata gives an empty result."""
+    assert parse_didl_metadata(didl) == {}
+
+
+@pytest.mark.parametrize(
+    ("seconds", "expected"),
+    [(0, "0:00:00"), (59, "0:00:59"), (251, "0:04:11"), (3725, "1:02:05"), (36000, "10:00:00")],
+)
+def test_format_duration(seconds: int, expected: str) -> None:
+    """Test seconds are formatted as H:MM:SS."""
+    assert format_duration(seconds) == expected
+    assert parse_duration(expected) == seconds
+
+
+@pytest.mark.parametrize(
+    ("play_mode", "shuffle", "repeat", "repeat_one"),
+    [
+        ("NORMAL", False, False, False),
+        ("REPEAT_ALL", False, True, False),
+        ("REPEAT_ONE", False, True, True),
+        ("SHUFFLE_NOREPEAT", True, False, False),
+        ("SHUFFLE", True, True, False),
+        ("SHUFFLE_REPEAT_ONE", True, True, True),
+    ],
+)
+def test_parse_play_mode(play_mode: str, shuffle: bool, repeat: bool, repeat_one: bool) -> None:
+    """Test each Sonos play mode maps onto shuffle and repeat flags."""
+    assert parse_play_mode(play_mode) == {
+        "shuffle": shuffle,
+        "repeat": repeat,
+        "repeat_one": repeat_one,
+    }
@@ -0,0 +1,24 @@
+"""Tests for the Sonos Subnet Discovery number platform."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.sonos_subnet.number import balance_channel_volumes
+
+
+@pytest.mark.parametrize(
+    ("balance", "volume", "expected"),
+    [
+        (0, 40, (40, 40)),
+        (-100, 40, (40, 0)),
+        (100, 40, (0, 40)),
+        (-50, 40, (40, 20)),
+        (50, 40, (20, 40)),
+        (-25, 30, (30, 22)),
+        (25, 30, (22, 30)),
+        (75, 0, (0, 0)),
+    ],
+)
+def test_balance_channel_volumes(balance: int, volume: int, expected: tuple[int, int]) -> None:
+    """Test the far channel is scaled down and the near one keeps the volume."""
+    assert balance_channel_volumes(balance, volume) == expected